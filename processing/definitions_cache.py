@@ -0,0 +1,69 @@
+"""JSON sidecar cache for the event definitions YAML."""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, List
+
+import yaml
+
+# libyaml-backed loader/dumper when PyYAML was built with it, pure-Python otherwise
+try:
+    from yaml import CSafeLoader as YamlSafeLoader, CSafeDumper as YamlSafeDumper
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader, SafeDumper as YamlSafeDumper
+
+log = logging.getLogger(__name__)
+
+
+def file_stamp(path: Path) -> List[int]:
+    """[mtime_ns, size] of *path*, used to tell whether a cached parse is stale."""
+    st = Path(path).stat()
+    return [st.st_mtime_ns, st.st_size]
+
+
+def load_definitions_yaml(yaml_path: Path) -> Any:
+    """
+    Load a definitions YAML document, going through a JSON sidecar cache.
+
+    The parsed document is written to ``<yaml>.json`` next to the source,
+    stamped with the YAML's mtime and size, and reused while that stamp still
+    matches, so callers only pay for a YAML parse after the file actually
+    changes.  Comparing a recorded stamp (rather than the two files' mtimes)
+    stays correct on filesystems with coarse timestamps.  Every call returns a
+    freshly decoded document, so callers may modify it.
+
+    Args:
+        yaml_path: Definitions file to load
+
+    Returns:
+        The parsed YAML document
+    """
+    yaml_path = Path(yaml_path)
+    cache_path = yaml_path.with_name(yaml_path.name + '.json')
+    stamp = file_stamp(yaml_path)
+    try:
+        cached = json.loads(cache_path.read_bytes())
+        if cached.get('stamp') == stamp:
+            return cached['data']
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass
+
+    with open(yaml_path, 'r') as f:
+        data = yaml.load(f, Loader=YamlSafeLoader)
+
+    # Write beside the target and swap it in so a concurrent reader never sees
+    # a half-written sidecar
+    tmp_path = cache_path.with_name(cache_path.name + f'.{os.getpid()}.tmp')
+    try:
+        tmp_path.write_bytes(json.dumps({'stamp': stamp, 'data': data}).encode())
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError) as e:
+        # Read-only install dir or non-JSON types: just skip the cache
+        log.debug("Could not write event definitions cache %s: %s", cache_path, e)
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+    return data
@@ -1,13 +1,28 @@
 ﻿"""Shared event display naming for UI and chapter export."""
 
+import functools
 
+# Longest prefix first so a more specific group always wins over a shorter one
+_GROUP_PREFIXES = tuple(sorted((('mcb_', 'MCB'), ('clutch_', 'Clutch')),
+                               key=lambda entry: len(entry[0]), reverse=True))
+
+
+@functools.lru_cache(maxsize=4096)
+def _split_event_name(event_name: str) -> tuple:
+    """(group label, title-cased remainder) for an event key, stripping the prefix once."""
+    for prefix, group in _GROUP_PREFIXES:
+        if event_name.startswith(prefix):
+            return group, event_name[len(prefix):].replace('_', ' ').title()
+    return 'General', event_name.replace('_', ' ').title()
+
+
+def event_short_name(event_name: str) -> str:
+    """Event key without its group prefix, as a title-cased label ("mcb_edge_hold" -> "Edge Hold")."""
+    return _split_event_name(event_name)[1]
+
+
+@functools.lru_cache(maxsize=4096)
 def format_event_display_name(event_name: str) -> str:
     """Format event key as a human-readable label (matches Custom Event Builder)."""
-    if event_name.startswith('mcb_'):
-        name = event_name.replace('mcb_', '').replace('_', ' ').title()
-        return f"MCB - {name}"
-    if event_name.startswith('clutch_'):
-        name = event_name.replace('clutch_', '').replace('_', ' ').title()
-        return f"Clutch - {name}"
-    name = event_name.replace('_', ' ').title()
-    return f"General - {name}"
+    group, name = _split_event_name(event_name)
+    return f"{group} - {name}"
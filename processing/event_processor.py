@@ -10,6 +10,7 @@ import sys
 sys.path.append(str(Path(__file__).parent.parent))
 from funscript import Funscript
 from processing.funscript_editor import FunscriptEditor, FunscriptEditorError
+from processing.definitions_cache import YamlSafeLoader, load_definitions_yaml
 from processing.chapter_export import (
     ChapterExportOptions,
     ChapterExportError,
@@ -30,8 +31,7 @@ def _load_event_definitions(definitions_path: Path) -> tuple[Dict[str, Any], Dic
         Tuple of (event_definitions, normalization_config)
     """
     try:
-        with open(definitions_path, 'r') as f:
-            config_data = yaml.safe_load(f)
+        config_data = load_definitions_yaml(definitions_path)
         if not isinstance(config_data, dict) or 'definitions' not in config_data:
             raise EventProcessorError("Event definitions file must contain a top-level 'definitions' key.")
 
@@ -147,7 +147,7 @@ def _parse_and_validate_user_events(event_file_path: Path, event_definitions: Di
     """
     try:
         with open(event_file_path, 'r') as f:
-            user_data = yaml.safe_load(f)
+            user_data = yaml.load(f, Loader=YamlSafeLoader)
     except Exception as e:
         raise EventProcessorError(f"Failed to parse user event YAML file '{event_file_path.name}': {e}")
 
@@ -79,24 +79,29 @@ def convert_funscript_prostate(funscript, points_per_second=25, algorithm="stand
 
 
 
+def _local_extrema_indices(positions):
+    """Return the indices of strict local minima and maxima in the position data."""
+    positions = np.asarray(positions, dtype=float)
+    if len(positions) < 3:
+        return np.empty(0, dtype=int)
+
+    prev_val = positions[:-2]
+    curr_val = positions[1:-1]
+    next_val = positions[2:]
+
+    is_max = (curr_val > prev_val) & (curr_val > next_val)
+    is_min = (curr_val < prev_val) & (curr_val < next_val)
+    return np.flatnonzero(is_max | is_min) + 1
+
+
 def _find_local_extrema(positions):
     """Find local minima and maxima in the position data."""
     extrema = []
 
-    if len(positions) < 3:
-        return extrema
-
-    for i in range(1, len(positions) - 1):
-        prev_val = positions[i-1]
+    for i in _local_extrema_indices(positions).tolist():
         curr_val = positions[i]
-        next_val = positions[i+1]
-
-        # Local maximum
-        if curr_val > prev_val and curr_val > next_val:
-            extrema.append({'index': i, 'value': curr_val, 'type': 'max'})
-        # Local minimum
-        elif curr_val < prev_val and curr_val < next_val:
-            extrema.append({'index': i, 'value': curr_val, 'type': 'min'})
+        extrema_type = 'max' if curr_val > positions[i-1] else 'min'
+        extrema.append({'index': i, 'value': curr_val, 'type': extrema_type})
 
     return extrema
 
@@ -126,27 +131,22 @@ def _convert_tear_shaped(funscript_positions, min_distance_from_center,
         stroke_threshold: minimum stroke range (0–1) to trigger the arc
             (default 0.25).
     """
-    n = len(funscript_positions)
-    alpha_values = np.asarray(funscript_positions, dtype=float).copy()
+    positions = np.asarray(funscript_positions, dtype=float)
+    n = len(positions)
+    alpha_values = positions.copy()
     beta_values = np.full(n, 0.5)
 
-    extrema = _find_local_extrema(funscript_positions)
+    extrema_indices = _local_extrema_indices(positions)
 
-    if len(extrema) < 2:
+    if len(extrema_indices) < 2:
         return np.clip(alpha_values, 0.0, 1.0), beta_values.copy()
 
-    boundaries = (
-        [{'index': 0, 'value': funscript_positions[0]}]
-        + [{'index': e['index'], 'value': e['value']} for e in extrema]
-        + [{'index': n - 1, 'value': funscript_positions[n - 1]}]
-    )
-
-    for k in range(len(boundaries) - 1):
-        b0 = boundaries[k]
-        b1 = boundaries[k + 1]
-        i0, i1 = b0['index'], b1['index']
-        v0, v1 = b0['value'], b1['value']
+    boundary_indices = np.concatenate(([0], extrema_indices, [n - 1]))
+    boundary_values = positions[boundary_indices]
 
+    strokes = zip(boundary_indices[:-1].tolist(), boundary_indices[1:].tolist(),
+                  boundary_values[:-1].tolist(), boundary_values[1:].tolist())
+    for i0, i1, v0, v1 in strokes:
         stroke_range = abs(v1 - v0)
         if stroke_range < stroke_threshold or stroke_range < 1e-9:
             # Short stroke: alpha = position, beta = 0.5 (already initialised)
@@ -156,10 +156,9 @@ def _convert_tear_shaped(funscript_positions, min_distance_from_center,
         bulge_wide = min(stroke_range / 2.0, 0.5)
         beta_dir = bulge_wide if going_up else -(bulge_wide * min_distance_from_center)
 
-        for i in range(i0, i1 + 1):
-            t = np.clip((funscript_positions[i] - v0) / (v1 - v0), 0.0, 1.0)
-            beta_values[i] = 0.5 + beta_dir * np.sin(t * np.pi)
-            # alpha_values[i] already set to funscript_positions[i]
+        # Whole stroke at once; alpha_values already holds the positions
+        t = np.clip((positions[i0:i1 + 1] - v0) / (v1 - v0), 0.0, 1.0)
+        beta_values[i0:i1 + 1] = 0.5 + beta_dir * np.sin(t * np.pi)
 
     # Smooth out any derivative kinks at segment boundaries.
     alpha_values = gaussian_smooth(alpha_values, sigma=2.0)
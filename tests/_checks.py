@@ -0,0 +1,16 @@
+"""
+Shared numeric checks for the 2D conversion tests.
+"""
+import numpy as np
+
+
+def probabilities_in_01(y):
+    """Return True if every value of y lies within 0-1."""
+    a = np.ascontiguousarray(y, dtype=np.float64)
+    return a.min() >= 0.0 and a.max() <= 1.0
+
+
+def out_of_range_values(y):
+    """Return the values of y outside 0-1. Only needed for reporting failures."""
+    a = np.asarray(y, dtype=np.float64)
+    return a[(a < 0) | (a > 1)]
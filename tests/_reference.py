@@ -0,0 +1,20 @@
+"""
+Shared loader for the reference funscript used by the 2D conversion tests.
+"""
+import functools
+from pathlib import Path
+
+from funscript import Funscript
+
+REFERENCE_FUNSCRIPT_PATH = Path(__file__).parent.parent / "testdata" / "test.funscript"
+
+
+@functools.lru_cache(maxsize=1)
+def load_reference_funscript():
+    """Load the reference funscript once per process, or return None if it is missing.
+
+    The returned Funscript is shared between tests and must not be modified in place.
+    """
+    if not REFERENCE_FUNSCRIPT_PATH.exists():
+        return None
+    return Funscript.from_file(REFERENCE_FUNSCRIPT_PATH)
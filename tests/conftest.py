@@ -6,5 +6,8 @@ All tests go through cli.py only — never import upstream internals directly.
 import sys
 from pathlib import Path
 
-# Ensure repo root is on the path so `import cli` works
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Ensure repo root is on the path so `import cli` works. This is the single
+# place tests extend sys.path; only add the entry once.
+_REPO_ROOT = str(Path(__file__).parent.parent)
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
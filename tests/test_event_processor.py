@@ -16,22 +16,12 @@ import sys
 sys.path.append(str(Path(__file__).parent.parent))
 from funscript import Funscript
 from funscript.funscript import funscript_cache
-from processing.event_processor import process_events, EventProcessorError
+from processing.event_processor import process_events, _load_event_definitions, EventProcessorError
 from processing.chapter_export import ChapterExportOptions
 
-
-class TestEventProcessor(unittest.TestCase):
-
-    def setUp(self):
-        """Set up a temporary directory with dummy funscript and event files, and event definitions."""
-        funscript_cache.clear()
-        self.test_dir = tempfile.TemporaryDirectory()
-        self.test_path = Path(self.test_dir.name)
-
-        # Create a minimal event_definitions.yml for tests (do not append to the full config file)
-        self.event_definitions_path = self.test_path / "event_definitions.yml"
-        with open(self.event_definitions_path, 'w') as f:
-            f.write("""
+# Minimal event definitions for tests (do not append to the full config file).
+# Kept at module level so the text is built once rather than per test.
+EVENT_DEFINITIONS_YML = """
 normalization:
   volume: {max: 1.0}
   pulse_frequency: {max: 200.0}
@@ -86,7 +76,20 @@ definitions:
           duration_ms: $duration_ms
           ramp_in_ms: $ramp_up
           mode: additive
-""")
+"""
+
+
+class TestEventProcessor(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a temporary directory with dummy funscript and event files, and event definitions."""
+        funscript_cache.clear()
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.test_path = Path(self.test_dir.name)
+
+        # Write the minimal event_definitions.yml for tests
+        self.event_definitions_path = self.test_path / "event_definitions.yml"
+        self.event_definitions_path.write_text(EVENT_DEFINITIONS_YML)
 
         # Create a dummy user event file
         self.event_file_path = self.test_path / "test.events.yml"
@@ -123,24 +126,33 @@ definitions:
         mod_pulse_freq_fs = Funscript.from_file(self.pulse_freq_path)
         mod_pulse_width_fs = Funscript.from_file(self.pulse_width_path)
 
-        # Verify 'good_slave_test' (500ms to 1500ms)
-        gs_indices = np.where((mod_volume_fs.x >= 0.5) & (mod_volume_fs.x < 1.5))[0]
-        self.assertTrue(np.allclose(mod_volume_fs.y[gs_indices], 0.7))
-        self.assertTrue(np.allclose(mod_pulse_freq_fs.y[gs_indices], 0.13)) # 27 / 200 = 0.135 -> 0.13
-        self.assertTrue(np.allclose(mod_pulse_width_fs.y[gs_indices], 0.45))
+        # Region boundaries: before | good_slave_test (500-1500ms) | edge_test (1500-2500ms) | after
+        x = mod_volume_fs.x
+        gs_start, gs_end, edge_end = np.searchsorted(x, [0.5, 1.5, 2.5])
+        gs = slice(gs_start, gs_end)
+        edge = slice(gs_end, edge_end)
+
+        # Volume: 0.7 during 'good_slave_test', unchanged 0.5 outside events.
+        # 'edge_test' is modulated, so it is checked separately below.
+        expected_volume = np.full_like(mod_volume_fs.y, 0.5)
+        expected_volume[gs] = 0.7
+        volume_ok = np.isclose(mod_volume_fs.y, expected_volume)
+        volume_ok[edge] = True
+        self.assertTrue(volume_ok.all(), f"Unexpected volume at indices {np.flatnonzero(~volume_ok)}")
+
+        # Pulse frequency: 27 / 200 = 0.135 -> 0.13 during 'good_slave_test', unchanged 0.25 after events
+        expected_pulse_freq = np.full_like(mod_pulse_freq_fs.y, 0.25)
+        expected_pulse_freq[gs] = 0.13
+        pulse_freq_ok = np.isclose(mod_pulse_freq_fs.y, expected_pulse_freq)
+        pulse_freq_ok[:gs_start] = True
+        pulse_freq_ok[edge] = True
+        self.assertTrue(pulse_freq_ok.all(), f"Unexpected pulse frequency at indices {np.flatnonzero(~pulse_freq_ok)}")
+
+        self.assertTrue(np.allclose(mod_pulse_width_fs.y[gs], 0.45))
 
         # Verify 'edge_test' (1500ms to 2500ms)
-        edge_indices = np.where((mod_volume_fs.x >= 1.5) & (mod_volume_fs.x < 2.5))[0]
-        self.assertFalse(np.allclose(mod_volume_fs.y[edge_indices], 0.6))
-        self.assertGreater(np.max(mod_volume_fs.y[edge_indices]), 0.6)
-
-        # Verify values outside event ranges are unchanged
-        before_indices = np.where(mod_volume_fs.x < 0.5)[0]
-        after_indices = np.where(mod_volume_fs.x >= 2.5)[0]
-        after_pf_indices = np.where(mod_pulse_freq_fs.x >= 2.5)[0]
-        self.assertTrue(np.allclose(mod_volume_fs.y[before_indices], 0.5))
-        self.assertTrue(np.allclose(mod_volume_fs.y[after_indices], 0.5))
-        self.assertTrue(np.allclose(mod_pulse_freq_fs.y[after_pf_indices], 0.25))
+        self.assertFalse(np.allclose(mod_volume_fs.y[edge], 0.6))
+        self.assertGreater(np.max(mod_volume_fs.y[edge]), 0.6)
 
 
     def test_chapter_export_to_base_funscript(self):
@@ -167,6 +179,19 @@ definitions:
         self.assertEqual(chapters[1]["startTime"], "00:00:00.500")
         self.assertEqual(chapters[1]["endTime"], "00:00:01.500")
 
+    def test_definitions_sidecar_cache(self):
+        """Definitions are cached beside the YAML and re-parsed once the YAML changes."""
+        sidecar = self.event_definitions_path.with_name(self.event_definitions_path.name + ".json")
+        definitions, _ = _load_event_definitions(self.event_definitions_path)
+        self.assertTrue(sidecar.exists())
+        self.assertEqual(definitions, yaml.safe_load(EVENT_DEFINITIONS_YML)["definitions"])
+
+        # A stale stamp must not be trusted, even if the sidecar is newer
+        self.event_definitions_path.write_text(EVENT_DEFINITIONS_YML.replace("duration_ms: 1000", "duration_ms: 12000", 1))
+        definitions, _ = _load_event_definitions(self.event_definitions_path)
+        self.assertEqual(definitions["good_slave_test"]["default_params"]["duration_ms"], 12000)
+        self.assertEqual(json.loads(sidecar.read_text())["data"]["definitions"], definitions)
+
 if __name__ == "__main__":
     print("Running Custom Event Processor Tests (New Architecture)...")
     suite = unittest.TestSuite()
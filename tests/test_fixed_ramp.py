@@ -8,6 +8,12 @@ sys.path.append(str(Path(__file__).parent))
 from funscript import Funscript
 from processing.special_generators import make_volume_ramp
 
+def _mock_funscript(duration_seconds):
+    """Create a mock funscript with start, 10s, near-end and end timing."""
+    x = [0, 10, duration_seconds - 1, duration_seconds]
+    y = [50, 60, 70, 80]  # dummy values
+    return Funscript(x, y)
+
 def test_fixed_ramp_calculation():
     """Test the fixed volume ramp calculation with various file durations."""
 
@@ -23,18 +29,16 @@ def test_fixed_ramp_calculation():
 
     print(f"Testing Fixed Volume Ramp Calculation (${ramp_percent_per_hour}% per hour)\n")
 
-    for duration_minutes, description in test_cases:
+    # Generate all ramps up front so the compute step is not interleaved with printing
+    ramps = [
+        make_volume_ramp(_mock_funscript(duration_minutes * 60), ramp_percent_per_hour)
+        for duration_minutes, _ in test_cases
+    ]
+
+    for (duration_minutes, description), ramp in zip(test_cases, ramps):
         print(f"=== {description} ===")
 
-        # Create mock funscript with appropriate timing
         duration_seconds = duration_minutes * 60
-        x = [0, 10, duration_seconds - 1, duration_seconds]  # start, 10s, near-end, end
-        y = [50, 60, 70, 80]  # dummy values
-
-        mock_funscript = Funscript(x, y)
-
-        # Generate volume ramp
-        ramp = make_volume_ramp(mock_funscript, ramp_percent_per_hour)
 
         # Calculate expected values
         file_duration_hours = duration_seconds / 3600.0
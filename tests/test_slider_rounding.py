@@ -3,14 +3,56 @@
 Test script to verify slider rounding works correctly.
 """
 
+from unittest.mock import MagicMock
+
 import tkinter as tk
 from ui.parameter_tabs import CombineRatioControl
 
 
+TEST_VALUES = [2.95, 3.14159, 6.666666, 1.12345, 9.87654]
+
+
+class _FakeVar:
+    """Pure-Python stand-in for tk.DoubleVar so the test does not need a display."""
+
+    def __init__(self, value=0.0):
+        self._value = value
+
+    def get(self):
+        return self._value
+
+    def set(self, value):
+        self._value = value
+
+
+def _make_headless_control(initial_value=2.0):
+    """Build a CombineRatioControl without creating any Tk widgets."""
+    control = CombineRatioControl.__new__(CombineRatioControl)
+    control.file1_name = "File1"
+    control.file2_name = "File2"
+    control.var = _FakeVar(initial_value)
+    control.percentage_label = MagicMock()
+    return control
+
+
 def test_slider_rounding():
     """Test that sliders round to one decimal place."""
     print("Testing slider rounding behavior...")
 
+    control = _make_headless_control()
+
+    print("\nTesting value rounding:")
+    for test_val in TEST_VALUES:
+        control.var.set(test_val)
+        control._on_change()  # Trigger rounding
+        result = control.var.get()
+        expected = round(test_val, 1)
+        print(f"  Input: {test_val:.6f} -> Output: {result} (Expected: {expected})")
+        assert abs(result - expected) < 0.01, f"Rounding error for {test_val}: got {result}"
+
+
+def run_interactive():
+    """Open a Tk window to test rounding by moving the slider manually."""
     # Create a test window
     root = tk.Tk()
     root.title("Slider Rounding Test")
@@ -24,11 +66,8 @@ def test_slider_rounding():
         min_val=1.0, max_val=10.0, row=0
     )
 
-    # Test various values
-    test_values = [2.95, 3.14159, 6.666666, 1.12345, 9.87654]
-
     print("\nTesting value rounding:")
-    for test_val in test_values:
+    for test_val in TEST_VALUES:
         control.var.set(test_val)
         control._on_change()  # Trigger rounding
         result = control.var.get()
@@ -55,14 +94,8 @@ def test_slider_rounding():
     print("\n[INFO] Test window opened. Move the slider to test rounding behavior.")
     print("       Close the window when done testing.")
 
-    # Don't run mainloop in automated testing
-    if __name__ == "__main__":
-        root.mainloop()
-    else:
-        root.destroy()
-
-    return True
+    root.mainloop()
 
 
 if __name__ == "__main__":
-    test_slider_rounding()
\ No newline at end of file
+    run_interactive()
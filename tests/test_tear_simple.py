@@ -2,29 +2,32 @@
 """
 Simple test of the new tear-shaped algorithm.
 """
-import sys
 from pathlib import Path
 import numpy as np
 
-sys.path.append(str(Path(__file__).parent.parent))
+if __name__ == "__main__":
+    # Run as a script rather than through pytest (whose conftest.py does this):
+    # make the repo root importable
+    import sys
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from funscript import Funscript
+from _checks import out_of_range_values, probabilities_in_01
+from _reference import REFERENCE_FUNSCRIPT_PATH, load_reference_funscript
 from processing.funscript_prostate_2d import generate_alpha_beta_prostate_from_main
 
+
 def test_tear_shaped_simple():
     """Simple test of the tear-shaped algorithm."""
     print("Testing tear-shaped algorithm (simple)...")
 
-    # Use the real test funscript
-    test_file = Path(__file__).parent.parent / "testdata" / "test.funscript"
+    # Use the real test funscript (parsed once and shared between tests)
+    original_funscript = load_reference_funscript()
 
-    if not test_file.exists():
-        print(f"Error: Test file not found at {test_file}")
+    if original_funscript is None:
+        print(f"Error: Test file not found at {REFERENCE_FUNSCRIPT_PATH}")
         return
 
     try:
-        # Load the original funscript
-        original_funscript = Funscript.from_file(test_file)
         print(f"Original funscript loaded: {len(original_funscript.y)} actions")
 
         # Test tear-shaped conversion with small sample
@@ -37,8 +40,8 @@ def test_tear_shaped_simple():
         )
 
         print(f"\nTear-shaped conversion results:")
-        print(f"Alpha range: {min(alpha_prostate.y):.3f} to {max(alpha_prostate.y):.3f}")
-        print(f"Beta range: {min(beta_prostate.y):.3f} to {max(beta_prostate.y):.3f}")
+        print(f"Alpha range: {alpha_prostate.y.min():.3f} to {alpha_prostate.y.max():.3f}")
+        print(f"Beta range: {beta_prostate.y.min():.3f} to {beta_prostate.y.max():.3f}")
         print(f"Output points: {len(alpha_prostate.y)}")
 
         # Check first 10 values
@@ -46,16 +49,15 @@ def test_tear_shaped_simple():
         print(f"First 10 beta values: {beta_prostate.y[:10]}")
 
         # Check for valid ranges
-        alpha_out_of_range = [v for v in alpha_prostate.y if v < 0 or v > 1]
-        beta_out_of_range = [v for v in beta_prostate.y if v < 0 or v > 1]
-
-        if alpha_out_of_range:
+        if not probabilities_in_01(alpha_prostate.y):
+            alpha_out_of_range = out_of_range_values(alpha_prostate.y)
             print(f"WARNING: {len(alpha_out_of_range)} alpha values out of 0-1 range")
             print(f"Examples: {alpha_out_of_range[:5]}")
         else:
             print("OK: All alpha values in 0-1 range")
 
-        if beta_out_of_range:
+        if not probabilities_in_01(beta_prostate.y):
+            beta_out_of_range = out_of_range_values(beta_prostate.y)
             print(f"WARNING: {len(beta_out_of_range)} beta values out of 0-1 range")
             print(f"Examples: {beta_out_of_range[:5]}")
         else:
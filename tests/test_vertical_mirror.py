@@ -2,29 +2,31 @@
 """
 Test that top-right-left is the vertical mirror of top-left-right.
 """
-import sys
 from pathlib import Path
 import numpy as np
 
-sys.path.append(str(Path(__file__).parent.parent))
+if __name__ == "__main__":
+    # Run as a script rather than through pytest (whose conftest.py does this):
+    # make the repo root importable
+    import sys
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from funscript import Funscript
+from _checks import probabilities_in_01
+from _reference import REFERENCE_FUNSCRIPT_PATH, load_reference_funscript
 from processing.funscript_1d_to_2d import generate_alpha_beta_from_main
 
 def test_vertical_mirror():
     """Test that top-right-left is the vertical mirror of top-left-right."""
     print("Testing vertical mirror relationship...")
 
-    # Use the real test funscript
-    test_file = Path(__file__).parent.parent / "testdata" / "test.funscript"
+    # Use the real test funscript (parsed once and shared between tests)
+    original_funscript = load_reference_funscript()
 
-    if not test_file.exists():
-        print(f"Error: Test file not found at {test_file}")
+    if original_funscript is None:
+        print(f"Error: Test file not found at {REFERENCE_FUNSCRIPT_PATH}")
         return
 
     try:
-        # Load the original funscript
-        original_funscript = Funscript.from_file(test_file)
         print(f"Original funscript loaded: {len(original_funscript.y)} actions")
 
         # Test top-left-right algorithm
@@ -38,8 +40,8 @@ def test_vertical_mirror():
         )
 
         print(f"Top-Left-Right results:")
-        print(f"Alpha range: {min(alpha_tlr.y):.3f} to {max(alpha_tlr.y):.3f}")
-        print(f"Beta range: {min(beta_tlr.y):.3f} to {max(beta_tlr.y):.3f}")
+        print(f"Alpha range: {alpha_tlr.y.min():.3f} to {alpha_tlr.y.max():.3f}")
+        print(f"Beta range: {beta_tlr.y.min():.3f} to {beta_tlr.y.max():.3f}")
         print(f"First 5 alpha: {alpha_tlr.y[:5]}")
         print(f"First 5 beta: {beta_tlr.y[:5]}")
 
@@ -54,23 +56,29 @@ def test_vertical_mirror():
         )
 
         print(f"Top-Right-Left results:")
-        print(f"Alpha range: {min(alpha_trl.y):.3f} to {max(alpha_trl.y):.3f}")
-        print(f"Beta range: {min(beta_trl.y):.3f} to {max(beta_trl.y):.3f}")
+        print(f"Alpha range: {alpha_trl.y.min():.3f} to {alpha_trl.y.max():.3f}")
+        print(f"Beta range: {beta_trl.y.min():.3f} to {beta_trl.y.max():.3f}")
         print(f"First 5 alpha: {alpha_trl.y[:5]}")
         print(f"First 5 beta: {beta_trl.y[:5]}")
 
         # Verify vertical mirroring
         print("\n=== VERIFICATION ===")
 
+        a_tlr = np.asarray(alpha_tlr.y, dtype=np.float64)
+        a_trl = np.asarray(alpha_trl.y, dtype=np.float64)
+        b_tlr = np.asarray(beta_tlr.y, dtype=np.float64)
+        b_trl = np.asarray(beta_trl.y, dtype=np.float64)
+        diff = np.empty_like(a_tlr)
+
         # Alpha should be the same
-        alpha_diff = np.abs(np.array(alpha_tlr.y) - np.array(alpha_trl.y))
-        max_alpha_diff = np.max(alpha_diff)
+        np.subtract(a_tlr, a_trl, out=diff)
+        max_alpha_diff = np.max(np.abs(diff, out=diff))
         print(f"Max alpha difference: {max_alpha_diff:.6f}")
 
         # Beta should be inverted (1.0 - beta_tlr should equal beta_trl)
-        beta_tlr_inverted = 1.0 - np.array(beta_tlr.y)
-        beta_diff = np.abs(beta_tlr_inverted - np.array(beta_trl.y))
-        max_beta_diff = np.max(beta_diff)
+        np.subtract(1.0, b_tlr, out=diff)
+        diff -= b_trl
+        max_beta_diff = np.max(np.abs(diff, out=diff))
         print(f"Max beta difference (after inversion): {max_beta_diff:.6f}")
 
         # Check if they're properly mirrored
@@ -84,6 +92,12 @@ def test_vertical_mirror():
         else:
             print("WARNING: Beta values are not properly inverted")
 
+        # All outputs should stay within 0-1
+        if all(probabilities_in_01(fs.y) for fs in (alpha_tlr, beta_tlr, alpha_trl, beta_trl)):
+            print("OK: All alpha/beta values in 0-1 range")
+        else:
+            print("WARNING: Some alpha/beta values are out of 0-1 range")
+
         # Show specific examples
         print(f"\nExample comparison:")
         print(f"TLR: Alpha={alpha_tlr.y[10]:.3f}, Beta={beta_tlr.y[10]:.3f}")
@@ -1,24 +1,103 @@
 import tkinter as tk
 from tkinter import ttk
-import sys
-from pathlib import Path
 
-sys.path.append(str(Path(__file__).parent.parent))
+
+# Tk variables backed directly by config values:
+# (attribute name, Var class, config section, config key, default)
+_VAR_SPECS = (
+    ('basic_algorithm_var', tk.StringVar, 'alpha_beta_generation', 'algorithm', 'circular'),
+    ('basic_min_distance_var', tk.DoubleVar, 'alpha_beta_generation', 'min_distance_from_center', 0.1),
+    ('basic_speed_threshold_var', tk.IntVar, 'alpha_beta_generation', 'speed_threshold_percent', 50),
+    ('basic_direction_prob_var', tk.DoubleVar, 'alpha_beta_generation', 'direction_change_probability', 0.1),
+    ('prostate_generate_var', tk.BooleanVar, 'prostate_generation', 'generate_prostate_files', True),
+    ('prostate_invert_var', tk.BooleanVar, 'prostate_generation', 'generate_from_inverted', True),
+    ('prostate_algorithm_var', tk.StringVar, 'prostate_generation', 'algorithm', 'standard'),
+    ('prostate_points_var', tk.IntVar, 'prostate_generation', 'points_per_second', 25),
+    ('prostate_min_distance_var', tk.DoubleVar, 'prostate_generation', 'min_distance_from_center', 0.5),
+)
+
+# Algorithm radiobuttons: (label, config value, grid row, grid column) for the
+# basic tab's 2x2 grid, and (label, config value) for the prostate tab's column
+_BASIC_ALGO_CHOICES = (
+    ("Top-Right-Bottom-Left (0°-270°)", "top-right-left", 0, 0),
+    ("Circular (0°-180°)", "circular", 0, 1),
+    ("Top-Left-Bottom-Right (0°-90°)", "top-left-right", 1, 0),
+    ("0-360 (restim original)", "restim-original", 1, 1),
+)
+_PROSTATE_ALGO_CHOICES = (
+    ("Standard (0°-180°)", "standard"),
+    ("Tear-shaped (0°-180°)", "tear-shaped"),
+)
+
+# Grid options shared by every label / input / hint row
+_W = tk.W
+_WE = (tk.W, tk.E)
+_ROW_PAD = {'padx': 5, 'pady': 5}
+
+# Named ttk styles owned by ConversionTabs for its parameter inputs. ttk resolves
+# a dotted name through its parent (TEntry / Horizontal.TScale / TSpinbox), so
+# they need no declaration and theme changes still apply.
+_ENTRY_STYLE = "Param.TEntry"
+_SCALE_STYLE = "Param.Horizontal.TScale"
+_SPINBOX_STYLE = "Param.TSpinbox"
+
+
+def _is_points_per_second(text):
+    """Key validation for points-per-second fields: empty or an integer in 1-100."""
+    return text == "" or (text.isdigit() and 1 <= int(text) <= 100)
+
+
+def _snap_command(var, step):
+    """Return a Scale command that snaps var to multiples of step."""
+    def _snap(value):
+        snapped = round(round(float(value) / step) * step, 2)
+        if snapped != var.get():
+            var.set(snapped)
+    return _snap
+
+
+def _state_script(groups):
+    """Build one Tcl script setting a ttk state flag on each widget of (widgets, flag) groups."""
+    return "\n".join(f"{widget} state {flag}" for widgets, flag in groups for widget in widgets)
 
 
 class ConversionTabs:
+    # Basic tab rows 1-3: (widget key prefix, input widget key, label, Var attribute,
+    # widget class, Var option name, widget options, snap step, hint, sticky)
+    _BASIC_SPEC = (
+        # Points per second — read-only, derived from interpolation_interval (Speed tab)
+        ('points', 'points_entry', "Points Per Second:", 'basic_points_var',
+         ttk.Entry, 'textvariable', {'width': 10, 'state': 'readonly', 'style': _ENTRY_STYLE}, None,
+         "Auto (= 1 / interpolation interval, set in Speed tab)", _W),
+        ('min_dist', 'min_dist_scale', "Min Distance From Center:", 'basic_min_distance_var',
+         ttk.Scale, 'variable', {'from_': 0.1, 'to': 0.9, 'orient': tk.HORIZONTAL, 'length': 150,
+                                  'style': _SCALE_STYLE}, 0.05,
+         "(0.1-0.9) Minimum radius from center", _WE),
+        ('speed', 'speed_scale', "Speed Threshold (%):", 'basic_speed_threshold_var',
+         ttk.Scale, 'variable', {'from_': 0, 'to': 100, 'orient': tk.HORIZONTAL, 'length': 150,
+                                  'style': _SCALE_STYLE}, None,
+         "(0-100%) Speed percentile for maximum radius", _WE),
+    )
+
+    _PROSTATE_TAB_INDEX = 1
+
     def __init__(self, parent, config, interpolation_interval_var=None):
         self.parent = parent
         self.config = config
         self.interpolation_interval_var = interpolation_interval_var
 
-        # Basic tab variables
-        algorithm_value = config['alpha_beta_generation'].get('algorithm', 'circular')
-        self.basic_algorithm_var = tk.StringVar(value=algorithm_value)
+        # Basic and prostate tab variables. All are created up front because
+        # get_basic_config/get_prostate_config read them even if a tab is never shown.
+        sections = {
+            'alpha_beta_generation': config.get('alpha_beta_generation', {}),
+            'prostate_generation': config.get('prostate_generation', {}),
+        }
+        for attr, var_class, section, key, default in _VAR_SPECS:
+            setattr(self, attr, var_class(value=sections[section].get(key, default)))
+
         # points_per_second is derived from interpolation_interval — not a free parameter.
-        interpolation_interval = config['speed'].get('interpolation_interval', 0.02)
-        computed_pps = round(1.0 / interpolation_interval)
-        self.basic_points_var = tk.IntVar(value=computed_pps)
+        self.basic_points_var = tk.IntVar(
+            value=round(1.0 / config['speed'].get('interpolation_interval', 0.02)))
         # If a live variable is provided, keep the display in sync
         if interpolation_interval_var is not None:
             def _update_pps(*_):
@@ -29,26 +108,34 @@ class ConversionTabs:
                 except Exception:
                     pass
             interpolation_interval_var.trace_add('write', _update_pps)
-        min_distance = config['alpha_beta_generation'].get('min_distance_from_center', 0.1)
-        self.basic_min_distance_var = tk.DoubleVar(value=min_distance)
-        speed_threshold = config['alpha_beta_generation'].get('speed_threshold_percent', 50)
-        self.basic_speed_threshold_var = tk.IntVar(value=speed_threshold)
-        direction_prob = config['alpha_beta_generation'].get('direction_change_probability', 0.1)
-        self.basic_direction_prob_var = tk.DoubleVar(value=direction_prob)
+
+        # Last get_basic_config/get_prostate_config results, dropped on any Var write
+        self._basic_cfg_cache = None
+        self._prostate_cfg_cache = None
+        for var in (self.basic_algorithm_var, self.basic_points_var, self.basic_min_distance_var,
+                    self.basic_speed_threshold_var, self.basic_direction_prob_var):
+            var.trace_add('write', self._invalidate_basic_cache)
+        for var in (self.prostate_generate_var, self.prostate_invert_var, self.prostate_algorithm_var,
+                    self.prostate_points_var, self.prostate_min_distance_var):
+            var.trace_add('write', self._invalidate_prostate_cache)
 
         # Widget references for enabling/disabling
         self.basic_widgets = {}
 
-        # Prostate tab variables
-        prostate_config = config.get('prostate_generation', {})
-        self.prostate_generate_var = tk.BooleanVar(value=prostate_config.get('generate_prostate_files', True))
-        self.prostate_invert_var = tk.BooleanVar(value=prostate_config.get('generate_from_inverted', True))
-        prostate_algorithm = prostate_config.get('algorithm', 'standard')
-        self.prostate_algorithm_var = tk.StringVar(value=prostate_algorithm)
-        prostate_points = prostate_config.get('points_per_second', 25)
-        self.prostate_points_var = tk.IntVar(value=prostate_points)
-        prostate_min_distance = prostate_config.get('min_distance_from_center', 0.5)
-        self.prostate_min_distance_var = tk.DoubleVar(value=prostate_min_distance)
+        # Prostate tab widgets are built on first display (see _on_tab_shown)
+        self._prostate_built = False
+        self._button_state = 'normal'
+
+        # Algorithm whose widget states are currently applied (see _on_algorithm_change)
+        self._last_algorithm = None
+
+        # Conversion buttons do nothing until set_conversion_callbacks is called
+        self.basic_conversion_callback = lambda: None
+        self.prostate_conversion_callback = lambda: None
+
+        # Direction label redraws are coalesced into one idle callback per burst
+        self._dir_update_pending = False
+        self._last_dir_text = ""
 
         self.setup_tabs()
 
@@ -99,12 +186,30 @@ class ConversionTabs:
         self.basic_frame = self._make_scrollable(_basic_outer)
         self.setup_basic_tab()
 
-        # Prostate conversion tab
-        _prostate_outer = ttk.Frame(self.notebook)
-        self.notebook.add(_prostate_outer, text="Prostate")
-        self.prostate_frame = self._make_scrollable(_prostate_outer)
+        # Prostate conversion tab — widgets are built the first time it is selected
+        self._prostate_outer = ttk.Frame(self.notebook)
+        self.notebook.add(self._prostate_outer, text="Prostate")
+        self._tab_changed_binding = self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_shown)
+
+    def _on_tab_shown(self, event=None):
+        """Build the prostate tab widgets when that tab is shown for the first time."""
+        if self._prostate_built or self.notebook.index("current") != self._PROSTATE_TAB_INDEX:
+            return
+        self._prostate_built = True
+        # Only needed once — drop the binding so later tab switches cost nothing
+        self.notebook.unbind("<<NotebookTabChanged>>", self._tab_changed_binding)
+        self.prostate_frame = self._make_scrollable(self._prostate_outer)
         self.setup_prostate_tab()
 
+    def _add_row(self, parent, row, label, widget, hint, sticky=_W):
+        """Grid a label / input widget / hint row and return the (label, hint) widgets."""
+        label_widget = ttk.Label(parent, text=label)
+        hint_widget = ttk.Label(parent, text=hint)
+        label_widget.grid(row=row, column=0, sticky=_W, **_ROW_PAD)
+        widget.grid(row=row, column=1, sticky=sticky, **_ROW_PAD)
+        hint_widget.grid(row=row, column=2, sticky=_W, **_ROW_PAD)
+        return label_widget, hint_widget
+
     def setup_basic_tab(self):
         """Setup the basic conversion tab."""
         # Algorithm selection
@@ -114,66 +219,41 @@ class ConversionTabs:
         algo_frame = ttk.Frame(self.basic_frame)
         algo_frame.grid(row=0, column=1, columnspan=2, sticky=(tk.W, tk.E), padx=5, pady=5)
 
-        ttk.Radiobutton(algo_frame, text="Top-Right-Bottom-Left (0°-270°)",
-                       variable=self.basic_algorithm_var, value="top-right-left",
-                       command=self._on_algorithm_change).grid(row=0, column=0, sticky=tk.W, padx=(0, 15), pady=1)
-        ttk.Radiobutton(algo_frame, text="Circular (0°-180°)",
-                       variable=self.basic_algorithm_var, value="circular",
-                       command=self._on_algorithm_change).grid(row=0, column=1, sticky=tk.W, pady=1)
-        ttk.Radiobutton(algo_frame, text="Top-Left-Bottom-Right (0°-90°)",
-                       variable=self.basic_algorithm_var, value="top-left-right",
-                       command=self._on_algorithm_change).grid(row=1, column=0, sticky=tk.W, padx=(0, 15), pady=1)
-        ttk.Radiobutton(algo_frame, text="0-360 (restim original)",
-                       variable=self.basic_algorithm_var, value="restim-original",
-                       command=self._on_algorithm_change).grid(row=1, column=1, sticky=tk.W, pady=1)
+        radio_common = dict(variable=self.basic_algorithm_var, command=self._on_algorithm_change)
+        for text, value, row, column in _BASIC_ALGO_CHOICES:
+            ttk.Radiobutton(algo_frame, text=text, value=value, **radio_common).grid(
+                row=row, column=column, sticky=tk.W, padx=(0, 15) if column == 0 else 0, pady=1)
 
-        # Points per second — read-only, derived from interpolation_interval (Speed tab)
-        self.basic_widgets['points_label'] = ttk.Label(self.basic_frame, text="Points Per Second:")
-        self.basic_widgets['points_label'].grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
-        self.basic_widgets['points_entry'] = ttk.Entry(self.basic_frame, textvariable=self.basic_points_var, width=10, state='readonly')
-        self.basic_widgets['points_entry'].grid(row=1, column=1, sticky=tk.W, padx=5, pady=5)
-        self.basic_widgets['points_desc'] = ttk.Label(self.basic_frame, text="Auto (= 1 / interpolation interval, set in Speed tab)")
-        self.basic_widgets['points_desc'].grid(row=1, column=2, sticky=tk.W, padx=5, pady=5)
+        bw = self.basic_widgets
+        frame = self.basic_frame
 
-        # Min Distance From Center
-        self.basic_widgets['min_dist_label'] = ttk.Label(self.basic_frame, text="Min Distance From Center:")
-        self.basic_widgets['min_dist_label'].grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
-        self.basic_widgets['min_dist_scale'] = ttk.Scale(self.basic_frame, from_=0.1, to=0.9,
-                                                          variable=self.basic_min_distance_var,
-                                                          orient=tk.HORIZONTAL, length=150)
-        self.basic_widgets['min_dist_scale'].grid(row=2, column=1, sticky=(tk.W, tk.E), padx=5, pady=5)
-        self.basic_widgets['min_dist_desc'] = ttk.Label(self.basic_frame, text="(0.1-0.9) Minimum radius from center")
-        self.basic_widgets['min_dist_desc'].grid(row=2, column=2, sticky=tk.W, padx=5, pady=5)
-
-        # Speed Threshold (%)
-        self.basic_widgets['speed_label'] = ttk.Label(self.basic_frame, text="Speed Threshold (%):")
-        self.basic_widgets['speed_label'].grid(row=3, column=0, sticky=tk.W, padx=5, pady=5)
-        self.basic_widgets['speed_scale'] = ttk.Scale(self.basic_frame, from_=0, to=100,
-                                                       variable=self.basic_speed_threshold_var,
-                                                       orient=tk.HORIZONTAL, length=150)
-        self.basic_widgets['speed_scale'].grid(row=3, column=1, sticky=(tk.W, tk.E), padx=5, pady=5)
-        self.basic_widgets['speed_desc'] = ttk.Label(self.basic_frame, text="(0-100%) Speed percentile for maximum radius")
-        self.basic_widgets['speed_desc'].grid(row=3, column=2, sticky=tk.W, padx=5, pady=5)
+        for row, (key, widget_key, label, var_attr, widget_class, var_option, options,
+                  snap, hint, sticky) in enumerate(self._BASIC_SPEC, start=1):
+            var = getattr(self, var_attr)
+            widget_options = {var_option: var, **options}
+            if snap:
+                widget_options['command'] = _snap_command(var, snap)
+            bw[widget_key] = widget_class(frame, **widget_options)
+            bw[key + '_label'], bw[key + '_desc'] = self._add_row(
+                frame, row, label, bw[widget_key], hint, sticky=sticky)
 
         # Direction Change Probability (for restim-original only)
-        self.basic_widgets['direction_label'] = ttk.Label(self.basic_frame, text="Direction Change Probability:")
-        self.basic_widgets['direction_label'].grid(row=4, column=0, sticky=tk.W, padx=5, pady=5)
-
         # Frame to hold slider and value display
-        direction_frame = ttk.Frame(self.basic_frame)
-        direction_frame.grid(row=4, column=1, sticky=(tk.W, tk.E), padx=5, pady=5)
-
-        self.basic_widgets['direction_scale'] = ttk.Scale(direction_frame, from_=0.0, to=1.0,
-                                                            variable=self.basic_direction_prob_var,
-                                                            orient=tk.HORIZONTAL, length=120)
-        self.basic_widgets['direction_scale'].pack(side=tk.LEFT, fill=tk.X, expand=True)
+        direction_frame = ttk.Frame(frame)
+        bw['direction_scale'] = ttk.Scale(direction_frame, from_=0.0, to=1.0,
+                                          variable=self.basic_direction_prob_var,
+                                          orient=tk.HORIZONTAL, length=120, style=_SCALE_STYLE,
+                                          command=_snap_command(self.basic_direction_prob_var, 0.01))
+        bw['direction_scale'].pack(side=tk.LEFT, fill=tk.X, expand=True)
 
         # Value display label
-        self.basic_widgets['direction_value'] = ttk.Label(direction_frame, text=f"{self.basic_direction_prob_var.get():.2f}", width=5)
-        self.basic_widgets['direction_value'].pack(side=tk.LEFT, padx=(5, 0))
+        self._last_dir_text = f"{self.basic_direction_prob_var.get():.2f}"
+        bw['direction_value'] = ttk.Label(direction_frame, text=self._last_dir_text, width=5)
+        bw['direction_value'].pack(side=tk.LEFT, padx=(5, 0))
 
-        self.basic_widgets['direction_desc'] = ttk.Label(self.basic_frame, text="(0.0-1.0) Probability of direction flip per segment")
-        self.basic_widgets['direction_desc'].grid(row=4, column=2, sticky=tk.W, padx=5, pady=5)
+        bw['direction_label'], bw['direction_desc'] = self._add_row(
+            frame, 4, "Direction Change Probability:", direction_frame,
+            "(0.0-1.0) Probability of direction flip per segment", sticky=_WE)
 
         # Add trace to update value display when slider changes
         self.basic_direction_prob_var.trace_add('write', self._update_direction_value_display)
@@ -185,6 +265,22 @@ class ConversionTabs:
         # Configure grid weights
         self.basic_frame.columnconfigure(1, weight=1)
 
+        # Widgets to disable for restim-original / enable only for restim-original
+        self._standard_group = [bw[name] for name in (
+            'points_label', 'points_entry', 'points_desc',
+            'min_dist_label', 'min_dist_scale', 'min_dist_desc',
+            'speed_label', 'speed_scale', 'speed_desc')]
+        self._restim_group = [bw[name] for name in (
+            'direction_label', 'direction_scale', 'direction_desc', 'direction_value')]
+
+        # The whole toggle as one Tcl script per outcome, keyed by is_restim
+        self._algorithm_state_scripts = {
+            is_restim: _state_script((
+                (self._standard_group, 'disabled' if is_restim else '!disabled'),
+                (self._restim_group, '!disabled' if is_restim else 'disabled')))
+            for is_restim in (False, True)
+        }
+
         # Initialize widget states based on current algorithm
         self._on_algorithm_change()
 
@@ -205,42 +301,58 @@ class ConversionTabs:
         algo_frame = ttk.Frame(self.prostate_frame)
         algo_frame.grid(row=2, column=1, columnspan=2, sticky=(tk.W, tk.E), padx=5, pady=5)
 
-        ttk.Radiobutton(algo_frame, text="Standard (0°-180°)",
-                       variable=self.prostate_algorithm_var, value="standard").pack(anchor=tk.W, pady=1)
-        ttk.Radiobutton(algo_frame, text="Tear-shaped (0°-180°)",
-                       variable=self.prostate_algorithm_var, value="tear-shaped").pack(anchor=tk.W, pady=1)
+        for text, value in _PROSTATE_ALGO_CHOICES:
+            ttk.Radiobutton(algo_frame, text=text, value=value,
+                            variable=self.prostate_algorithm_var).pack(anchor=tk.W, pady=1)
 
-        # Points per second
-        ttk.Label(self.prostate_frame, text="Points Per Second:").grid(row=3, column=0, sticky=tk.W, padx=5, pady=5)
-        points_entry = ttk.Entry(self.prostate_frame, textvariable=self.prostate_points_var, width=10)
-        points_entry.grid(row=3, column=1, sticky=tk.W, padx=5, pady=5)
-        ttk.Label(self.prostate_frame, text="(1-100) Interpolation density").grid(row=3, column=2, sticky=tk.W, padx=5, pady=5)
+        # Points per second — not bound via textvariable; keystrokes are only
+        # vetted, and prostate_points_var is synced when focus leaves the field
+        vcmd = (self.parent.register(self._validate_prostate_points), '%V', '%P')
+        self.prostate_points_spinbox = ttk.Spinbox(self.prostate_frame, from_=1, to=100, increment=1,
+                                                   width=10, style=_SPINBOX_STYLE,
+                                                   validate='all', validatecommand=vcmd)
+        self.prostate_points_spinbox.set(self.prostate_points_var.get())
+        self._add_row(self.prostate_frame, 3, "Points Per Second:", self.prostate_points_spinbox,
+                      "(1-100) Interpolation density")
 
         # Min Distance From Center
-        ttk.Label(self.prostate_frame, text="Min Distance From Center:").grid(row=4, column=0, sticky=tk.W, padx=5, pady=5)
         min_distance_scale = ttk.Scale(self.prostate_frame, from_=0.3, to=0.9, variable=self.prostate_min_distance_var,
-                                      orient=tk.HORIZONTAL, length=150)
-        min_distance_scale.grid(row=4, column=1, sticky=(tk.W, tk.E), padx=5, pady=5)
-        ttk.Label(self.prostate_frame, text="(0.3-0.9) Distance for tear-shaped constant zone").grid(row=4, column=2, sticky=tk.W, padx=5, pady=5)
+                                      orient=tk.HORIZONTAL, length=150, style=_SCALE_STYLE,
+                                      command=_snap_command(self.prostate_min_distance_var, 0.05))
+        self._add_row(self.prostate_frame, 4, "Min Distance From Center:", min_distance_scale,
+                      "(0.3-0.9) Distance for tear-shaped constant zone", sticky=_WE)
 
         # Convert to 2D button
-        self.prostate_convert_button = ttk.Button(self.prostate_frame, text="Convert to 2D", command=self.convert_prostate_2d)
+        self.prostate_convert_button = ttk.Button(self.prostate_frame, text="Convert to 2D", command=self.convert_prostate_2d,
+                                                  state=self._button_state)
         self.prostate_convert_button.grid(row=5, column=0, columnspan=3, pady=10)
 
         # Configure grid weights
         self.prostate_frame.columnconfigure(1, weight=1)
 
+    def _validate_prostate_points(self, reason, text):
+        """Spinbox validatecommand: vet keystrokes, sync prostate_points_var on focus-out."""
+        if reason == 'key':
+            return _is_points_per_second(text)
+        if reason == 'focusout':
+            self._commit_prostate_points(text)
+        return True
+
+    def _commit_prostate_points(self, text):
+        """Store a valid points-per-second text in prostate_points_var."""
+        # Only write on a real change: every set() fires the invalidating trace
+        if _is_points_per_second(text) and text and int(text) != self.prostate_points_var.get():
+            self.prostate_points_var.set(int(text))
+
     def convert_basic_2d(self):
         """Trigger basic 2D conversion."""
         # This will be connected to the main window's conversion function
-        if hasattr(self, 'basic_conversion_callback'):
-            self.basic_conversion_callback()
+        self.basic_conversion_callback()
 
     def convert_prostate_2d(self):
         """Trigger prostate 2D conversion."""
         # This will be connected to the main window's conversion function
-        if hasattr(self, 'prostate_conversion_callback'):
-            self.prostate_conversion_callback()
+        self.prostate_conversion_callback()
 
     def set_conversion_callbacks(self, basic_callback, prostate_callback):
         """Set callback functions for conversion buttons."""
@@ -249,66 +361,74 @@ class ConversionTabs:
 
     def set_button_state(self, state):
         """Set the state of both conversion buttons."""
+        self._button_state = state
         self.basic_convert_button.config(state=state)
-        self.prostate_convert_button.config(state=state)
+        if self._prostate_built:
+            self.prostate_convert_button.config(state=state)
 
     def _update_direction_value_display(self, *args):
-        """Update the direction change probability value display."""
-        if 'direction_value' in self.basic_widgets:
-            value = self.basic_direction_prob_var.get()
-            self.basic_widgets['direction_value'].config(text=f"{value:.2f}")
+        """Schedule a direction change probability label update at idle time."""
+        if not self._dir_update_pending:
+            self._dir_update_pending = True
+            self.parent.after_idle(self._flush_direction_value)
+
+    def _flush_direction_value(self):
+        """Draw the latest direction change probability into its label."""
+        self._dir_update_pending = False
+        text = f"{self.basic_direction_prob_var.get():.2f}"
+        if text == self._last_dir_text or 'direction_value' not in self.basic_widgets:
+            return
+        self._last_dir_text = text
+        self.basic_widgets['direction_value'].config(text=text)
 
     def _on_algorithm_change(self):
         """Update widget states based on selected algorithm."""
         algorithm = self.basic_algorithm_var.get()
+        if algorithm == self._last_algorithm:
+            return
+        self._last_algorithm = algorithm
         is_restim = (algorithm == "restim-original")
 
-        # Widgets to disable for restim-original
-        standard_widgets = [
-            'points_label', 'points_entry', 'points_desc',
-            'min_dist_label', 'min_dist_scale', 'min_dist_desc',
-            'speed_label', 'speed_scale', 'speed_desc'
-        ]
-
-        # Widgets to enable only for restim-original
-        restim_widgets = [
-            'direction_label', 'direction_scale', 'direction_desc', 'direction_value'
-        ]
-
-        # Set state for standard algorithm widgets
-        state = 'disabled' if is_restim else 'normal'
-        for widget_name in standard_widgets:
-            if widget_name in self.basic_widgets:
-                widget = self.basic_widgets[widget_name]
-                if isinstance(widget, (ttk.Entry, ttk.Scale)):
-                    widget.config(state=state)
-                # Labels don't need state change but could be grayed out
-                # For now just disable interactive widgets
-
-        # Set state for restim-specific widgets
-        restim_state = 'normal' if is_restim else 'disabled'
-        for widget_name in restim_widgets:
-            if widget_name in self.basic_widgets:
-                widget = self.basic_widgets[widget_name]
-                if isinstance(widget, (ttk.Entry, ttk.Scale)):
-                    widget.config(state=restim_state)
+        # ttk state flags don't propagate through frames, so each widget in a
+        # group is flagged directly. Labels included, so they grey out too;
+        # the points entry keeps its separate 'readonly' flag.
+        # Both groups are flipped in a single Tcl round-trip.
+        self.parent.tk.eval(self._algorithm_state_scripts[is_restim])
+
+    def _invalidate_basic_cache(self, *args):
+        self._basic_cfg_cache = None
+
+    def _invalidate_prostate_cache(self, *args):
+        self._prostate_cfg_cache = None
+
+    def invalidate_cache(self):
+        """Drop cached conversion configs, e.g. after changing Vars with tracing suspended."""
+        self._basic_cfg_cache = None
+        self._prostate_cfg_cache = None
 
     def get_basic_config(self):
         """Get current basic conversion configuration."""
-        return {
-            'algorithm': self.basic_algorithm_var.get(),
-            'points_per_second': self.basic_points_var.get(),
-            'min_distance_from_center': self.basic_min_distance_var.get(),
-            'speed_threshold_percent': self.basic_speed_threshold_var.get(),
-            'direction_change_probability': self.basic_direction_prob_var.get()
-        }
+        if self._basic_cfg_cache is None:
+            self._basic_cfg_cache = {
+                'algorithm': self.basic_algorithm_var.get(),
+                'points_per_second': self.basic_points_var.get(),
+                'min_distance_from_center': self.basic_min_distance_var.get(),
+                'speed_threshold_percent': self.basic_speed_threshold_var.get(),
+                'direction_change_probability': self.basic_direction_prob_var.get()
+            }
+        return dict(self._basic_cfg_cache)
 
     def get_prostate_config(self):
         """Get current prostate conversion configuration."""
-        return {
-            'generate_prostate_files': self.prostate_generate_var.get(),
-            'generate_from_inverted': self.prostate_invert_var.get(),
-            'algorithm': self.prostate_algorithm_var.get(),
-            'points_per_second': self.prostate_points_var.get(),
-            'min_distance_from_center': self.prostate_min_distance_var.get()
-        }
\ No newline at end of file
+        if self._prostate_built:
+            # Pick up a value typed into the spinbox that hasn't lost focus yet
+            self._commit_prostate_points(self.prostate_points_spinbox.get())
+        if self._prostate_cfg_cache is None:
+            self._prostate_cfg_cache = {
+                'generate_prostate_files': self.prostate_generate_var.get(),
+                'generate_from_inverted': self.prostate_invert_var.get(),
+                'algorithm': self.prostate_algorithm_var.get(),
+                'points_per_second': self.prostate_points_var.get(),
+                'min_distance_from_center': self.prostate_min_distance_var.get()
+            }
+        return dict(self._prostate_cfg_cache)
\ No newline at end of file
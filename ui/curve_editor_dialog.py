@@ -8,17 +8,30 @@ custom control point manipulation, and real-time preview.
 import tkinter as tk
 from tkinter import ttk, messagebox
 from typing import List, Tuple, Dict, Any, Optional
+import bisect
 import copy
+import functools
 
-try:
-    import matplotlib.pyplot as plt
-    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-    from matplotlib.figure import Figure
-    import matplotlib.patches as patches
-    import numpy as np
-    MATPLOTLIB_AVAILABLE = True
-except ImportError:
-    MATPLOTLIB_AVAILABLE = False
+import numpy as np
+
+# Matplotlib is imported the first time an editor panel is built (see _ensure_mpl),
+# so importing this module stays cheap. None means not tried yet.
+MATPLOTLIB_AVAILABLE = None
+FigureCanvasTkAgg = None
+Figure = None
+
+
+def _ensure_mpl() -> bool:
+    """Import the matplotlib classes the editor needs on first call; return availability."""
+    global MATPLOTLIB_AVAILABLE, FigureCanvasTkAgg, Figure
+    if MATPLOTLIB_AVAILABLE is None:
+        try:
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+            from matplotlib.figure import Figure
+            MATPLOTLIB_AVAILABLE = True
+        except ImportError:
+            MATPLOTLIB_AVAILABLE = False
+    return MATPLOTLIB_AVAILABLE
 
 # Import from processing modules
 import sys
@@ -28,6 +41,62 @@ from processing.linear_mapping import apply_linear_response_curve, validate_cont
 from processing.motion_axis_generation import get_curve_presets, create_custom_curve
 
 
+def _polyline_vertices(cp_arr):
+    """Return (x, y) arrays of the exact response-curve polyline for x-sorted (N, 2) points."""
+    # apply_linear_response_curve interpolates linearly between the points and
+    # holds the end values flat, so the points plus x=0 / x=1 are all that's drawn
+    xs = np.concatenate(([0.0], cp_arr[:, 0], [1.0]))
+    ys = np.concatenate((cp_arr[:1, 1], cp_arr[:, 1], cp_arr[-1:, 1]))
+    return xs, ys
+
+
+@functools.lru_cache(maxsize=32)
+def _curve_arrays(points):
+    """
+    Return (points array, polyline x, polyline y) for a tuple of x-sorted (x, y) points.
+
+    Cached so switching presets or resetting reuses earlier arrays; they are
+    returned read-only because they are shared between calls.
+    """
+    cp_arr = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    xs, ys = _polyline_vertices(cp_arr)
+    for arr in (cp_arr, xs, ys):
+        arr.flags.writeable = False
+    return cp_arr, xs, ys
+
+
+def _format_point_rows(control_points):
+    """Format control points as ('x.xxx', 'y.yyy') treeview rows."""
+    return [(format(x, '.3f'), format(y, '.3f')) for x, y in control_points]
+
+
+# Figure, axes and plot artists shared by every editor dialog (the editor is
+# modal, so only one uses it at a time). Building them is the slow part of
+# opening the dialog; each dialog only attaches a new Tk canvas.
+_SHARED_PLOT = None
+
+
+def _shared_plot():
+    """Return (figure, axes, curve line, points scatter, selection scatter), creating them once."""
+    global _SHARED_PLOT
+    if _SHARED_PLOT is None:
+        fig = Figure(figsize=(6, 4.5), dpi=80)
+        ax = fig.add_subplot(111)
+
+        # Static axes setup and persistent artists; update_curve_display only changes their data
+        ax.set_xlim(0, 1)
+        ax.set_ylim(0, 1)
+        ax.set_xlabel('Input Position')
+        ax.set_ylabel('Output Position')
+        ax.grid(True, alpha=0.3)
+        curve_line, = ax.plot([], [], 'b-', linewidth=2)
+        points_scatter = ax.scatter([], [], c='red', s=50, zorder=5)
+        sel_scatter = ax.scatter([], [], c='orange', s=80, zorder=6, marker='o',
+                                 linewidth=2, edgecolor='black')
+        _SHARED_PLOT = (fig, ax, curve_line, points_scatter, sel_scatter)
+    return _SHARED_PLOT
+
+
 class CurveEditorDialog:
     """
     Modal dialog for editing motion axis response curves.
@@ -50,14 +119,31 @@ class CurveEditorDialog:
         """
         self.parent = parent
         self.axis_name = axis_name.upper()
-        self.original_curve = copy.deepcopy(current_curve)
-        self.current_curve = copy.deepcopy(current_curve)
+        self.original_curve = dict(current_curve)
+        # Immutable snapshot of the original points for reset_curve and the on_cancel
+        # dirty check. Points are kept sorted by x so edits can insert with bisect.
+        self._orig_points = tuple(sorted((tuple(p) for p in current_curve['control_points']),
+                                         key=lambda p: p[0]))
+        self._orig_name = current_curve.get('name')
+        self.current_curve = dict(current_curve, control_points=list(self._orig_points))
         self.result = None  # Will store the final curve configuration
 
         # Control point editing state
         self.selected_point_index = None
         self.dragging = False
 
+        # Treeview row iids, parallel to current_curve['control_points']
+        self._point_iids = []
+        self._drag_start_index = None
+
+        # Plot artists (created in setup_editor_panel) are blitted while a point is dragged
+        self._drag_artists = []
+        self._drag_background = None
+
+        # Motion events are coalesced into at most one drag update per ~frame
+        self._motion_pending = False
+        self._last_motion_xy = None
+
         # Create modal dialog
         self.dialog = tk.Toplevel(parent)
         self.dialog.title(f"Edit {self.axis_name} Curve")
@@ -177,25 +263,30 @@ class CurveEditorDialog:
         editor_frame.columnconfigure(0, weight=1)
         editor_frame.rowconfigure(0, weight=1)
 
-        if not MATPLOTLIB_AVAILABLE:
+        if not _ensure_mpl():
             # Fallback if matplotlib not available
             fallback_label = ttk.Label(editor_frame, text="Matplotlib not available for curve editing")
             fallback_label.grid(row=0, column=0, pady=20)
             return
 
-        # Create matplotlib figure
-        self.fig = Figure(figsize=(6, 4.5), dpi=80)
-        self.ax = self.fig.add_subplot(111)
+        # The figure, axes and artists are shared across dialogs; only the Tk canvas is new
+        self.fig, self.ax, self.curve_line, self.points_scatter, self.sel_scatter = _shared_plot()
 
         # Create canvas
         self.canvas = FigureCanvasTkAgg(self.fig, editor_frame)
-        self.canvas.draw()
-        self.canvas.get_tk_widget().grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-
-        # Bind mouse events for interaction
-        self.canvas.mpl_connect('button_press_event', self.on_canvas_click)
-        self.canvas.mpl_connect('button_release_event', self.on_canvas_release)
-        self.canvas.mpl_connect('motion_notify_event', self.on_canvas_motion)
+        self.canvas.draw_idle()
+        canvas_widget = self.canvas.get_tk_widget()
+        canvas_widget.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        canvas_widget.bind('<Destroy>', lambda e: self._teardown(), add='+')
+
+        # Bind mouse events for interaction. Callbacks are stored on the shared
+        # figure, so _teardown disconnects them again.
+        self._mpl_cids = [
+            self.canvas.mpl_connect('button_press_event', self.on_canvas_click),
+            self.canvas.mpl_connect('button_release_event', self.on_canvas_release),
+            self.canvas.mpl_connect('motion_notify_event', self.on_canvas_motion),
+            self.canvas.mpl_connect('resize_event', self.on_canvas_resize),
+        ]
 
         # Instructions
         instructions = ttk.Label(editor_frame,
@@ -275,11 +366,11 @@ class CurveEditorDialog:
     def load_presets(self):
         """Load available curve presets into the listbox."""
         self.presets = get_curve_presets()
+        self._preset_keys = list(self.presets.keys())  # listbox row -> preset key
 
+        # Replace all rows with one insert call rather than one Tcl round trip per preset
         self.presets_listbox.delete(0, tk.END)
-        for preset_name, preset_data in self.presets.items():
-            display_name = preset_data['name']
-            self.presets_listbox.insert(tk.END, display_name)
+        self.presets_listbox.insert(tk.END, *(preset_data['name'] for preset_data in self.presets.values()))
 
     def on_preset_select(self, event):
         """Handle preset selection in listbox."""
@@ -293,18 +384,17 @@ class CurveEditorDialog:
             return
 
         # Get selected preset
-        preset_names = list(self.presets.keys())
-        if selection[0] >= len(preset_names):
+        if selection[0] >= len(self._preset_keys):
             return
 
-        preset_key = preset_names[selection[0]]
+        preset_key = self._preset_keys[selection[0]]
         preset_data = self.presets[preset_key]
 
         # Update current curve
         self.current_curve = {
             'name': preset_data['name'],
             'description': preset_data['description'],
-            'control_points': preset_data['control_points'].copy()
+            'control_points': sorted(preset_data['control_points'], key=lambda p: p[0])
         }
 
         # Update displays
@@ -316,60 +406,96 @@ class CurveEditorDialog:
         if not MATPLOTLIB_AVAILABLE:
             return
 
-        # Clear the axes
-        self.ax.clear()
-
-        # Set up the plot
-        self.ax.set_xlim(0, 1)
-        self.ax.set_ylim(0, 1)
-        self.ax.set_xlabel('Input Position')
-        self.ax.set_ylabel('Output Position')
         self.ax.set_title(f"{self.current_curve['name']}")
-        self.ax.grid(True, alpha=0.3)
-
-        # Generate curve data
-        control_points = self.current_curve['control_points']
-        if len(control_points) >= 2:
-            x_vals = np.linspace(0, 1, 101)
-            y_vals = []
-
-            for x in x_vals:
-                y = apply_linear_response_curve(x, control_points)
-                y_vals.append(y)
+        self._set_artist_data()
 
-            # Plot the curve
-            self.ax.plot(x_vals, y_vals, 'b-', linewidth=2, label='Response Curve')
+        # Refresh canvas; draw_idle coalesces repeated requests into one render
+        self.canvas.draw_idle()
 
-        # Plot control points
-        if control_points:
-            x_points = [p[0] for p in control_points]
-            y_points = [p[1] for p in control_points]
-
-            # Plot all control points
-            self.ax.scatter(x_points, y_points, c='red', s=50, zorder=5, label='Control Points')
-
-            # Highlight selected point
-            if self.selected_point_index is not None and self.selected_point_index < len(control_points):
-                x_sel = control_points[self.selected_point_index][0]
-                y_sel = control_points[self.selected_point_index][1]
-                self.ax.scatter([x_sel], [y_sel], c='orange', s=80, zorder=6, marker='o', linewidth=2, edgecolor='black')
+    def _set_artist_data(self):
+        """Push the current control points and selection into the persistent plot artists."""
+        control_points = self.current_curve['control_points']
 
-        # Add legend
-        self.ax.legend(loc='upper left', fontsize=8)
+        # Control points; the (N, 2) array is also kept for the mouse hit tests
+        if self.dragging:
+            # Points change on every drag frame, so caching them would only churn
+            self._cp_arr = np.asarray(control_points, dtype=np.float64).reshape(-1, 2)
+            xs, ys = _polyline_vertices(self._cp_arr)
+        else:
+            self._cp_arr, xs, ys = _curve_arrays(tuple(map(tuple, control_points)))
+        self.points_scatter.set_offsets(self._cp_arr)
 
-        # Refresh canvas
+        # Response curve needs at least two points
+        if len(control_points) >= 2:
+            self.curve_line.set_data(xs, ys)
+            self.curve_line.set_visible(True)
+        else:
+            self.curve_line.set_visible(False)
+
+        # Highlight selected point
+        if self.selected_point_index is not None and self.selected_point_index < len(control_points):
+            self.sel_scatter.set_offsets([control_points[self.selected_point_index]])
+        else:
+            self.sel_scatter.set_offsets(np.empty((0, 2)))
+
+    def _begin_drag_blit(self):
+        """Render the static plot once and cache it as the background for dragging."""
+        self._drag_artists = [self.curve_line, self.points_scatter, self.sel_scatter]
+        for artist in self._drag_artists:
+            artist.set_animated(True)
+        self._capture_drag_background()
+        self._blit_drag_artists()
+
+    def _capture_drag_background(self):
+        """Draw everything except the animated artists and snapshot the axes area."""
         self.canvas.draw()
+        self._drag_background = self.canvas.copy_from_bbox(self.ax.bbox)
+
+    def _blit_drag_artists(self):
+        """Repaint only the curve and point artists over the cached background."""
+        self.canvas.restore_region(self._drag_background)
+        for artist in self._drag_artists:
+            self.ax.draw_artist(artist)
+        self.canvas.blit(self.ax.bbox)
+
+    def _update_drag_artists(self):
+        """Push the current control points into the animated artists and blit them."""
+        self._set_artist_data()
+        if self._drag_background is None:
+            self._capture_drag_background()
+        self._blit_drag_artists()
+
+    def _end_drag_blit(self):
+        """Return the artists to normal rendering and do one full redraw."""
+        for artist in self._drag_artists:
+            artist.set_animated(False)
+        self._drag_artists = []
+        self._drag_background = None
+        self.update_curve_display()
 
     def update_points_list(self):
         """Update the control points list in the treeview."""
-        # Clear existing items
-        for item in self.points_tree.get_children():
-            self.points_tree.delete(item)
+        rows = _format_point_rows(self.current_curve['control_points'])
 
-        # Add current control points
-        control_points = self.current_curve['control_points']
-        for i, (x, y) in enumerate(control_points):
-            self.points_tree.insert('', 'end', values=(f'{x:.3f}', f'{y:.3f}'))
+        # Same number of points: rewrite the existing rows in place
+        if rows and len(rows) == len(self._point_iids):
+            for iid, values in zip(self._point_iids, rows):
+                self.points_tree.item(iid, values=values)
+            return
+
+        # Clear existing items in one call
+        if self._point_iids:
+            self.points_tree.delete(*self._point_iids)
+
+        # Add current control points; row iids are kept parallel to control_points
+        insert = self.points_tree.insert
+        self._point_iids = [insert('', 'end', values=values) for values in rows]
+
+    def _update_point_rows(self, first: int, last: int):
+        """Rewrite the treeview rows first..last in place from the control points."""
+        rows = _format_point_rows(self.current_curve['control_points'][first:last + 1])
+        for iid, values in zip(self._point_iids[first:last + 1], rows):
+            self.points_tree.item(iid, values=values)
 
     def on_canvas_click(self, event):
         """Handle mouse clicks on the matplotlib canvas."""
@@ -381,21 +507,23 @@ class CurveEditorDialog:
             return
 
         # Clamp coordinates to valid range
-        x = max(0.0, min(1.0, x))
-        y = max(0.0, min(1.0, y))
+        x = 0.0 if x < 0.0 else 1.0 if x > 1.0 else x
+        y = 0.0 if y < 0.0 else 1.0 if y > 1.0 else y
 
         if event.button == 1:  # Left click
             # Check if clicking near an existing point
             tolerance = 0.05
-            control_points = self.current_curve['control_points']
-
-            for i, (px, py) in enumerate(control_points):
-                if abs(px - x) < tolerance and abs(py - y) < tolerance:
-                    # Start dragging existing point
-                    self.selected_point_index = i
-                    self.dragging = True
-                    self.update_curve_display()
-                    return
+            cp_arr = self._cp_arr
+            hits = np.flatnonzero((np.abs(cp_arr[:, 0] - x) < tolerance) &
+                                  (np.abs(cp_arr[:, 1] - y) < tolerance))
+            if hits.size:
+                # Start dragging existing point
+                self.selected_point_index = int(hits[0])
+                self._drag_start_index = self.selected_point_index
+                self.dragging = True
+                self.update_curve_display()
+                self._begin_drag_blit()
+                return
 
             # Add new control point
             self.add_control_point(x, y)
@@ -406,7 +534,20 @@ class CurveEditorDialog:
 
     def on_canvas_release(self, event):
         """Handle mouse button release on canvas."""
+        if not self.dragging:
+            return
+        self._flush_motion()  # apply a position still waiting for the throttle
         self.dragging = False
+        self._end_drag_blit()
+
+        # A drag moves one point, shifting at most the rows between its start
+        # and end index, so those rows are rewritten in place
+        start, end = self._drag_start_index, self.selected_point_index
+        self._update_point_rows(min(start, end), max(start, end))
+
+    def on_canvas_resize(self, event):
+        """Drop the cached drag background; it no longer matches the canvas size."""
+        self._drag_background = None
 
     def on_canvas_motion(self, event):
         """Handle mouse motion on canvas."""
@@ -421,40 +562,45 @@ class CurveEditorDialog:
             return
 
         # Clamp coordinates
-        x = max(0.0, min(1.0, x))
-        y = max(0.0, min(1.0, y))
+        x = 0.0 if x < 0.0 else 1.0 if x > 1.0 else x
+        y = 0.0 if y < 0.0 else 1.0 if y > 1.0 else y
+
+        # Keep only the latest position; apply it at most once per ~16 ms
+        self._last_motion_xy = (x, y)
+        if not self._motion_pending:
+            self._motion_pending = True
+            self.dialog.after(16, self._flush_motion)
+
+    def _flush_motion(self):
+        """Apply the most recent drag position to the selected control point."""
+        self._motion_pending = False
+        if not self.dragging or self._last_motion_xy is None:
+            return
+        x, y = self._last_motion_xy
+        self._last_motion_xy = None
 
         # Update control point
         control_points = self.current_curve['control_points']
         if self.selected_point_index < len(control_points):
-            control_points[self.selected_point_index] = (x, y)
-
-            # Re-sort control points by x coordinate
-            control_points.sort(key=lambda p: p[0])
+            # Move the point by re-inserting it at its sorted position
+            control_points.pop(self.selected_point_index)
+            self.selected_point_index = self._insert_point(x, y)
 
-            # Find new index of the moved point
-            for i, (px, py) in enumerate(control_points):
-                if abs(px - x) < 0.001 and abs(py - y) < 0.001:
-                    self.selected_point_index = i
-                    break
+            # Only the curve and points are repainted while dragging;
+            # the points list is refreshed on release
+            self._update_drag_artists()
 
-            # Update displays
-            self.update_curve_display()
-            self.update_points_list()
+    def _insert_point(self, x: float, y: float) -> int:
+        """Insert (x, y) into the x-sorted control points and return its index."""
+        control_points = self.current_curve['control_points']
+        # Bisect over the x values (bisect's key= argument needs Python 3.10)
+        i = bisect.bisect_right([p[0] for p in control_points], x)
+        control_points.insert(i, (x, y))
+        return i
 
     def add_control_point(self, x: float, y: float):
         """Add a new control point."""
-        control_points = self.current_curve['control_points']
-        control_points.append((x, y))
-
-        # Sort by x coordinate
-        control_points.sort(key=lambda p: p[0])
-
-        # Find index of new point
-        for i, (px, py) in enumerate(control_points):
-            if abs(px - x) < 0.001 and abs(py - y) < 0.001:
-                self.selected_point_index = i
-                break
+        self.selected_point_index = self._insert_point(x, y)
 
         # Update displays
         self.update_curve_display()
@@ -469,17 +615,11 @@ class CurveEditorDialog:
             return
 
         # Find nearest point
-        min_distance = float('inf')
-        nearest_index = None
-
-        for i, (px, py) in enumerate(control_points):
-            distance = ((px - x) ** 2 + (py - y) ** 2) ** 0.5
-            if distance < min_distance:
-                min_distance = distance
-                nearest_index = i
+        distances = np.hypot(self._cp_arr[:, 0] - x, self._cp_arr[:, 1] - y)
+        nearest_index = int(distances.argmin())
 
         # Remove if close enough
-        if nearest_index is not None and min_distance < 0.1:
+        if distances[nearest_index] < 0.1:
             control_points.pop(nearest_index)
             self.selected_point_index = None
 
@@ -493,8 +633,7 @@ class CurveEditorDialog:
         if selection:
             # Get index of selected item
             item = selection[0]
-            all_items = self.points_tree.get_children()
-            self.selected_point_index = all_items.index(item)
+            self.selected_point_index = self._point_iids.index(item)
 
             # Update curve display to highlight selected point
             self.update_curve_display()
@@ -555,7 +694,7 @@ class CurveEditorDialog:
     def reset_curve(self):
         """Reset curve to original state."""
         if messagebox.askyesno("Reset Curve", "Reset curve to original state? This will lose all changes."):
-            self.current_curve = copy.deepcopy(self.original_curve)
+            self.current_curve = dict(self.original_curve, control_points=list(self._orig_points))
             self.selected_point_index = None
 
             # Update displays
@@ -579,9 +718,10 @@ class CurveEditorDialog:
                                "• No duplicate X coordinates")
             return
 
-        # Ensure we have end points at 0 and 1
-        has_start = any(abs(p[0] - 0.0) < 0.001 for p in control_points)
-        has_end = any(abs(p[0] - 1.0) < 0.001 for p in control_points)
+        # Ensure we have end points at 0 and 1; points are kept sorted by x,
+        # so only the first and last need checking
+        has_start = abs(control_points[0][0] - 0.0) < 0.001
+        has_end = abs(control_points[-1][0] - 1.0) < 0.001
 
         if not has_start or not has_end:
             if messagebox.askyesno("Missing End Points",
@@ -591,30 +731,46 @@ class CurveEditorDialog:
                 if not has_start:
                     # Find Y value at start
                     y_start = apply_linear_response_curve(0.0, control_points)
-                    control_points.append((0.0, y_start))
+                    control_points.insert(0, (0.0, y_start))
 
                 if not has_end:
                     # Find Y value at end
                     y_end = apply_linear_response_curve(1.0, control_points)
                     control_points.append((1.0, y_end))
 
-                # Re-sort
-                control_points.sort(key=lambda p: p[0])
                 self.current_curve['control_points'] = control_points
 
         # Set result and close
         self.result = copy.deepcopy(self.current_curve)
+        self._teardown()
         self.dialog.destroy()
 
     def on_cancel(self):
         """Cancel editing and close dialog."""
-        if self.current_curve != self.original_curve:
+        points = tuple(map(tuple, self.current_curve['control_points']))
+        if points != self._orig_points or self.current_curve.get('name') != self._orig_name:
             if not messagebox.askyesno("Discard Changes", "Discard all changes to the curve?"):
                 return
 
         self.result = None
+        self._teardown()
         self.dialog.destroy()
 
+    def _teardown(self):
+        """Detach this dialog from the shared figure and drop its canvas and Agg buffers."""
+        if getattr(self, 'canvas', None) is None:
+            return
+        for cid in self._mpl_cids:
+            self.canvas.mpl_disconnect(cid)
+        self._mpl_cids = []
+        for artist in self._drag_artists:  # closed mid-drag
+            artist.set_animated(False)
+        self._drag_artists = []
+        self._drag_background = None
+        self.fig = None
+        self.ax = None
+        self.canvas = None
+
     def show(self) -> Optional[Dict[str, Any]]:
         """
         Show the dialog and return the result.
@@ -6,16 +6,22 @@ custom event timelines without requiring manual YAML editing.
 """
 
 import bisect
+import copy
+import functools
+import heapq
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import json
 import logging
+import operator
+import os
+import re
 import threading
 import traceback
 import zipfile
 import yaml
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
 
 log = logging.getLogger(__name__)
 
@@ -33,9 +39,11 @@ if _sys.platform == 'win32':
 import sys
 sys.path.append(str(Path(__file__).parent.parent))
 
-from processing.event_processor import process_events, EventProcessorError
 from processing.chapter_export import ChapterExportOptions
-from processing.event_display import format_event_display_name
+from processing.definitions_cache import (
+    YamlSafeDumper, YamlSafeLoader, file_stamp, load_definitions_yaml,
+)
+from processing.event_display import event_short_name, format_event_display_name
 import ui.theme as _theme
 
 
@@ -68,10 +76,110 @@ def get_resource_path(relative_path: str) -> Path:
         return Path(__file__).parent.parent / relative_path
 
 
+# Sort key for timeline events
+_time_key = operator.itemgetter('time')
+
+
+def _bisect_time_right(events: List[Dict[str, Any]], time_ms) -> int:
+    """bisect_right over time-sorted *events* by their 'time'.
+
+    Written out because bisect's key= argument needs Python 3.10.
+    """
+    lo, hi = 0, len(events)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if time_ms < events[mid]['time']:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
+@functools.lru_cache(maxsize=4096)
+def _event_row_values(time_ms: int, event_name: str, duration_ms) -> tuple:
+    """(time, event, duration) column texts for an Event List row."""
+    m, s = divmod(time_ms // 1000, 60)
+    d_str = f"{duration_ms // 1000}s" if duration_ms else '—'
+    return f"{m}:{s:02d}", format_event_display_name(event_name), d_str
+
+
 # Path to the event definitions YAML file
 EVENT_DEFINITIONS_PATH = get_resource_path("config.event_definitions.yml")
 
 
+def load_event_definitions(yaml_path: Path = None) -> Dict[str, Any]:
+    """
+    Load the event definitions YAML through its JSON sidecar cache.
+
+    Args:
+        yaml_path: Definitions file to load (defaults to EVENT_DEFINITIONS_PATH)
+
+    Returns:
+        Dict: The parsed definitions document
+    """
+    return load_definitions_yaml(Path(yaml_path or EVENT_DEFINITIONS_PATH))
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_event_definitions(yaml_path: str, stamp: tuple) -> Dict[str, Any]:
+    data = load_event_definitions(Path(yaml_path))
+    # Resolve the optional 'default_params' once here so the dialog can copy
+    # event_def['default_params'] directly instead of .get(..., {}) per use
+    for event_def in (data.get('definitions') or {}).values():
+        if event_def.get('default_params') is None:
+            event_def['default_params'] = {}
+    return data
+
+
+def _get_event_definitions() -> Dict[str, Any]:
+    """Parsed EVENT_DEFINITIONS_PATH, reused across dialog openings until the file changes.
+
+    Each caller gets its own deep copy, so edits made by one dialog never leak
+    into the cached parse seen by the next.
+    """
+    return copy.deepcopy(_cached_event_definitions(str(EVENT_DEFINITIONS_PATH),
+                                                   tuple(file_stamp(EVENT_DEFINITIONS_PATH))))
+
+
+_EVENT_DUMP_CHUNK = 256
+
+
+class _EventFileDumper(YamlSafeDumper):
+    """Safe dumper that writes shared objects out in full instead of as &id/* aliases.
+
+    Each chunk in _dump_event_file is a separate yaml.dump whose anchor names
+    restart at id001, so an object shared across chunks would otherwise end up
+    with duplicate anchors that no YAML loader accepts.
+    """
+
+    def ignore_aliases(self, data):
+        return True
+
+
+def _dump_event_file(data: Dict[str, Any], stream) -> None:
+    """Write an event file document to *stream*, emitting the events in chunks.
+
+    yaml.dump builds a node for every value before emitting anything, so the
+    header keys go out first and the event list follows a chunk of events at a
+    time; this keeps peak memory bounded on long timelines.  PyYAML writes block
+    sequences under a mapping key without indentation, so each chunk's "- "
+    items line up under 'events:'.
+    """
+    header = {k: v for k, v in data.items() if k != 'events'}
+    if header:
+        yaml.dump(header, stream, Dumper=_EventFileDumper,
+                  default_flow_style=False, sort_keys=False)
+    events = data.get('events') or []
+    if not events:
+        yaml.dump({'events': events}, stream, Dumper=_EventFileDumper,
+                  default_flow_style=False, sort_keys=False)
+        return
+    stream.write('events:\n')
+    for start in range(0, len(events), _EVENT_DUMP_CHUNK):
+        yaml.dump(events[start:start + _EVENT_DUMP_CHUNK], stream, Dumper=_EventFileDumper,
+                  default_flow_style=False, sort_keys=False)
+
+
 class EventLibraryPanel(ttk.Frame):
     """Panel for browsing and selecting event definitions"""
 
@@ -80,9 +188,16 @@ class EventLibraryPanel(ttk.Frame):
         self.event_definitions = event_definitions
         self.groups = groups
         self.on_select_callback = on_select_callback
+        self._search_after_id = None
+        self._tree_items = []
+        self._non_empty_prefixes = tuple(sorted((g['prefix'] for g in groups if g['prefix']),
+                                                key=len, reverse=True))
 
         self.setup_ui()
+        # Definitions do not change while the panel is open: categorize once
+        self._categorized = self.categorize_events()
         self.populate_events()
+        self.create_tooltip_support()
 
     def setup_ui(self):
         """Create the UI components"""
@@ -128,29 +243,25 @@ class EventLibraryPanel(ttk.Frame):
 
     def categorize_events(self) -> List[Dict[str, Any]]:
         """Group events by category based on groups configuration"""
-        categorized = []
+        # Each event goes to the group with the longest matching prefix;
+        # events matching no prefix fall into the "" (general) group
+        buckets = {g['prefix']: [] for g in self.groups}
+        for event_name in sorted(self.event_definitions.keys()):
+            for prefix in self._non_empty_prefixes:
+                if event_name.startswith(prefix):
+                    break
+            else:
+                prefix = ""
+            if prefix in buckets:
+                buckets[prefix].append(event_name)
 
+        categorized = []
         for group in self.groups:
-            group_name = group['name']
-            prefix = group['prefix']
-            description = group['description']
-            events = []
-
-            for event_name in sorted(self.event_definitions.keys()):
-                # Match events by prefix
-                if prefix == "":
-                    # General category - events without known prefixes
-                    if not any(event_name.startswith(g['prefix']) for g in self.groups if g['prefix'] != ""):
-                        events.append(event_name)
-                else:
-                    # Specific category - events with matching prefix
-                    if event_name.startswith(prefix):
-                        events.append(event_name)
-
+            events = buckets[group['prefix']]
             if events:  # Only include groups with events
                 categorized.append({
-                    'name': group_name,
-                    'description': description,
+                    'name': group['name'],
+                    'description': group['description'],
                     'events': events
                 })
 
@@ -158,96 +269,122 @@ class EventLibraryPanel(ttk.Frame):
 
     def populate_events(self):
         """Populate the event tree with categorized events"""
-        categories = self.categorize_events()
+        categories = self._categorized
+        # Drop any previous rows, including ones the search filter detached
+        if self._tree_items:
+            self.event_tree.delete(
+                *(item_id for _, children in self._tree_items for item_id, _ in children),
+                *(category_id for category_id, _ in self._tree_items))
         self.category_tooltips = {}  # Store category descriptions for tooltips
+        self._tree_items = []  # (category_id, [(item_id, lowercased event name), ...])
+        self._item_to_event = {}  # event item id -> event name (categories are absent)
 
+        # Unmanage the tree while filling it so Tk lays it out once, not per insert
+        self.event_tree.pack_forget()
         for category_info in categories:
             # Add category as parent
             category_id = self.event_tree.insert('', 'end', text=category_info['name'], open=True)
             self.category_tooltips[category_id] = category_info['description']
 
             # Add events as children
+            children = []
             for event_name in category_info['events']:
-                # Create display name (remove prefix, replace _ with space, title case)
-                display_name = event_name.replace('mcb_', '').replace('clutch_', '').replace('_', ' ').title()
-                self.event_tree.insert(category_id, 'end', text=display_name,
-                                       values=(event_name,), tags=('event',))
-
-        # Add tooltip support
-        self.create_tooltip_support()
+                display_name = event_short_name(event_name)
+                item_id = self.event_tree.insert(category_id, 'end', text=display_name,
+                                                 tags=('event',))
+                self._item_to_event[item_id] = event_name
+                children.append((item_id, event_name.lower()))
+            self._tree_items.append((category_id, children))
+        self.event_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
     def create_tooltip_support(self):
         """Add tooltip support for category items"""
-        self.tooltip_label = None
+        # One tooltip window for the panel's lifetime, shown and withdrawn as needed
+        self.tooltip_label = tk.Toplevel(self)
+        self.tooltip_label.wm_overrideredirect(True)
+        self.tooltip_label.withdraw()
+        self._tooltip_text_label = tk.Label(self.tooltip_label, background="lightyellow",
+                                            relief=tk.SOLID, borderwidth=1,
+                                            font=('TkDefaultFont', 9), wraplength=300,
+                                            justify=tk.LEFT, padx=5, pady=3)
+        self._tooltip_text_label.pack()
+        self._tooltip_item = None
+        self._pending_motion = None
+        self._last_motion_xy = None
 
         def on_motion(event):
-            # Get item under mouse
-            item = self.event_tree.identify_row(event.y)
-            if item and item in self.category_tooltips:
-                # Show tooltip for category
-                if self.tooltip_label is None:
-                    self.tooltip_label = tk.Toplevel(self)
-                    self.tooltip_label.wm_overrideredirect(True)
-                    label = tk.Label(self.tooltip_label, text=self.category_tooltips[item],
-                                   background="lightyellow", relief=tk.SOLID, borderwidth=1,
-                                   font=('TkDefaultFont', 9), wraplength=300, justify=tk.LEFT,
-                                   padx=5, pady=3)
-                    label.pack()
-
-                # Position tooltip near mouse
-                x = event.x_root + 15
-                y = event.y_root + 10
-                self.tooltip_label.wm_geometry(f"+{x}+{y}")
-            else:
-                # Hide tooltip
-                self.hide_tooltip()
+            # Coalesce motion events: at most one tooltip update per idle turn
+            self._last_motion_xy = (event.y, event.x_root, event.y_root)
+            if self._pending_motion is None:
+                self._pending_motion = self.after_idle(self._process_motion)
 
         def on_leave(event):
+            if self._pending_motion is not None:
+                self.after_cancel(self._pending_motion)
+                self._pending_motion = None
             self.hide_tooltip()
 
         self.event_tree.bind('<Motion>', on_motion)
         self.event_tree.bind('<Leave>', on_leave)
 
+    def _process_motion(self):
+        """Update the category tooltip for the latest pointer position"""
+        self._pending_motion = None
+        y, x_root, y_root = self._last_motion_xy
+
+        # Get item under mouse
+        item = self.event_tree.identify_row(y)
+        if item and item in self.category_tooltips:
+            # Position tooltip near mouse
+            self.tooltip_label.wm_geometry(f"+{x_root + 15}+{y_root + 10}")
+
+            # Show tooltip for category
+            if item != self._tooltip_item:
+                self._tooltip_text_label.config(text=self.category_tooltips[item])
+                if self._tooltip_item is None:
+                    self.tooltip_label.deiconify()
+                self._tooltip_item = item
+        else:
+            # Hide tooltip
+            self.hide_tooltip()
+
     def hide_tooltip(self):
-        """Hide the tooltip if it exists"""
-        if self.tooltip_label:
-            self.tooltip_label.destroy()
-            self.tooltip_label = None
+        """Hide the tooltip if it is showing"""
+        if self._tooltip_item is not None:
+            self.tooltip_label.withdraw()
+            self._tooltip_item = None
 
     def on_search_changed(self, *args):
-        """Filter events based on search text"""
+        """Filter events based on search text (debounced while typing)"""
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(80, self._apply_filter)
+
+    def _apply_filter(self):
+        """Show only the events matching the search text, detaching the rest"""
+        self._search_after_id = None
         search_text = self.search_var.get().lower()
+        tree = self.event_tree
 
-        # Clear current display
-        for item in self.event_tree.get_children():
-            self.event_tree.delete(item)
-
-        if not search_text:
-            # No search, show all categories
-            self.populate_events()
-            return
-
-        # Search and display matching events
-        matches = []
-        for event_name in self.event_definitions.keys():
-            if search_text in event_name.lower():
-                matches.append(event_name)
-
-        if matches:
-            search_category = self.event_tree.insert('', 'end', text='Search Results', open=True)
-            for event_name in sorted(matches):
-                display_name = event_name.replace('mcb_', '').replace('clutch_', '').replace('_', ' ').title()
-                self.event_tree.insert(search_category, 'end', text=display_name,
-                                       values=(event_name,), tags=('event',))
+        # Pull the categories out first so re-attaching children does not relayout the view
+        tree.detach(*(category_id for category_id, _ in self._tree_items))
+        for category_id, children in self._tree_items:
+            matches = [item_id for item_id, name in children if search_text in name]
+            if not matches:
+                continue
+            if len(matches) != len(children):
+                tree.detach(*(item_id for item_id, _ in children))
+            for item_id in matches:
+                tree.reattach(item_id, category_id, 'end')
+            tree.reattach(category_id, '', 'end')
 
     def on_event_selected(self, event):
         """Handle event selection in tree"""
         selection = self.event_tree.selection()
         if selection:
-            item = selection[0]
             # Check if it's an event (not a category)
-            if self.event_tree.item(item, 'tags'):
-                event_name = self.event_tree.item(item, 'values')[0]
+            event_name = self._item_to_event.get(selection[0])
+            if event_name:
                 self.add_to_timeline_btn.config(state='normal')
                 if self.on_select_callback:
                     self.on_select_callback(event_name)
@@ -261,18 +398,77 @@ class EventLibraryPanel(ttk.Frame):
     def on_add_to_timeline(self):
         """Add selected event to timeline"""
         selection = self.event_tree.selection()
-        if selection and self.event_tree.item(selection[0], 'tags'):
+        if selection and selection[0] in self._item_to_event:
             # This will be handled by the parent dialog
             pass
 
     def get_selected_event(self) -> Optional[str]:
         """Get currently selected event name"""
         selection = self.event_tree.selection()
-        if selection and self.event_tree.item(selection[0], 'tags'):
-            return self.event_tree.item(selection[0], 'values')[0]
+        if selection:
+            return self._item_to_event.get(selection[0])
         return None
 
 
+def _coerce_int(value) -> int:
+    return int(value) if isinstance(value, (int, float)) else int(float(value))
+
+
+def _coerce_freq(value):
+    fval = float(value)
+    return fval if fval % 1.0 != 0.0 else int(fval)
+
+
+class _ParamSpec(NamedTuple):
+    """How an event parameter is edited and read back, derived from its name."""
+    kind: str               # 'int', 'float', 'freq' or 'generic'
+    spin: Optional[tuple]   # (from_, to, increment) for 'int' / 'float' spinboxes
+    unit: str
+    coerce: Optional[Callable[[Any], Any]]  # applied by get_parameter_values
+
+
+_NORMALIZED_PARAM_WORDS = ('amplitude', 'intensity', 'volume',
+                           'offset', 'boost', 'reduction', 'shift', 'drop')
+
+
+@functools.lru_cache(maxsize=512)
+def _classify_param(param_name: str) -> _ParamSpec:
+    """Classify a parameter once per name instead of on every widget build / read."""
+    lower = param_name.lower()
+
+    # Control type
+    if param_name.endswith('_ms'):
+        kind, spin, unit = 'int', (0, 60000, 100), 'ms'
+    elif 'freq' in lower or param_name == 'pulse_rate':
+        kind, spin, unit = 'freq', None, 'Hz'
+    elif param_name == 'pulse_width' or param_name.endswith('_width'):
+        kind, spin, unit = 'int', (0, 100, 1), '%'
+    elif param_name.endswith('_phase'):
+        kind, spin, unit = 'int', (0, 360, 15), '°'
+    elif any(word in param_name for word in _NORMALIZED_PARAM_WORDS):
+        kind, spin, unit = 'float', (-1.0, 1.0, 0.01), ''
+    else:
+        kind, spin, unit = 'generic', None, ''
+
+    # Type conversion when reading values back
+    if param_name.endswith('_ms') or param_name == 'pulse_rate' or param_name == 'pulse_width':
+        coerce = _coerce_int
+    elif 'freq' in lower:
+        coerce = _coerce_freq
+    elif param_name.endswith('_phase'):
+        coerce = _coerce_int
+    else:
+        coerce = None  # Keep as is (float or string)
+
+    return _ParamSpec(kind, spin, unit, coerce)
+
+
+@functools.lru_cache(maxsize=512)
+def _param_label(param_name: str) -> str:
+    """Form label for a parameter ("ramp_up_ms" -> "Ramp Up Ms"), title-cased once per name."""
+    return param_name.replace('_', ' ').title()
+
+
 class ParameterPanel(ttk.Frame):
     """Panel for editing event parameters with dynamic form generation"""
 
@@ -280,9 +476,11 @@ class ParameterPanel(ttk.Frame):
         super().__init__(parent)
         self.current_event_name = None
         self.current_event_definition = None
+        self._preview_parts = []  # see _build_preview_parts
         self.current_params = {}
         self.param_widgets = {}
         self.param_vars = {}  # Store variable objects
+        self._preview_job = None  # pending debounced steps-preview refresh
         self.current_time_ms = 0
         self.time_var = tk.IntVar(value=0)
 
@@ -324,10 +522,9 @@ class ParameterPanel(ttk.Frame):
         scrollbar = ttk.Scrollbar(canvas_frame, orient='vertical', command=self.canvas.yview)
 
         self.params_frame = ttk.Frame(self.canvas)
-        self.params_frame.bind('<Configure>',
-                               lambda e: self.canvas.configure(scrollregion=self.canvas.bbox('all')))
+        self.params_frame.bind('<Configure>', self._on_params_frame_configure)
 
-        self.canvas.create_window((0, 0), window=self.params_frame, anchor='nw')
+        self._params_window = self.canvas.create_window((0, 0), window=self.params_frame, anchor='nw')
         self.canvas.configure(yscrollcommand=scrollbar.set)
 
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -356,10 +553,25 @@ class ParameterPanel(ttk.Frame):
 
         self.show_placeholder()
 
+    def _on_params_frame_configure(self, event):
+        self.canvas.configure(scrollregion=self.canvas.bbox('all'))
+
+    def _replace_params_frame(self):
+        """Swap in an empty params frame.
+
+        Destroying the old frame takes all its children with it in one call,
+        instead of one destroy (and geometry update) per parameter widget.
+        """
+        old_frame = self.params_frame
+        self.params_frame = ttk.Frame(self.canvas)
+        self.params_frame.bind('<Configure>', self._on_params_frame_configure)
+        self.canvas.itemconfigure(self._params_window, window=self.params_frame)
+        old_frame.destroy()
+
     def show_placeholder(self):
         """Show placeholder when no event is selected"""
-        for widget in self.params_frame.winfo_children():
-            widget.destroy()
+        if self.params_frame.winfo_children():
+            self._replace_params_frame()
 
         label = ttk.Label(self.params_frame, text="Select an event to edit parameters",
                          foreground='gray')
@@ -377,6 +589,7 @@ class ParameterPanel(ttk.Frame):
         """Load and display parameters for an event"""
         self.current_event_name = event_name
         self.current_event_definition = event_definition
+        self._preview_parts = self._build_preview_parts(event_definition)
         default_params = event_definition.get('default_params', {})
         self.current_params = current_params if current_params else default_params.copy()
         self.current_time_ms = event_time_ms
@@ -385,8 +598,7 @@ class ParameterPanel(ttk.Frame):
         # Clear existing widgets
         if not self.params_frame.winfo_exists():
             return
-        for widget in self.params_frame.winfo_children():
-            widget.destroy()
+        self._replace_params_frame()
         self.param_widgets = {}
         self.param_vars = {}
 
@@ -430,11 +642,8 @@ class ParameterPanel(ttk.Frame):
 
         # MM:SS display
         def format_time():
-            ms = self.time_var.get()
-            total_seconds = ms / 1000
-            minutes = int(total_seconds // 60)
-            seconds = int(total_seconds % 60)
-            return f"({minutes}:{seconds:02d})"
+            minutes, rem = divmod(int(self.time_var.get()), 60000)
+            return f"({minutes}:{rem // 1000:02d})"
 
         self.time_display_label = ttk.Label(frame, text=format_time(), foreground='gray', width=8)
         self.time_display_label.grid(row=0, column=3, padx=(5, 5))
@@ -494,8 +703,7 @@ class ParameterPanel(ttk.Frame):
         frame.pack(fill=tk.X, padx=5, pady=2)
 
         # Label
-        display_name = param_name.replace('_', ' ').title()
-        label = ttk.Label(frame, text=display_name + ':', width=15, anchor='w')
+        label = ttk.Label(frame, text=_param_label(param_name) + ':', width=15, anchor='w')
         label.grid(row=0, column=0, sticky=tk.W, padx=(0, 5))
 
         # Determine control type and create widget
@@ -512,18 +720,23 @@ class ParameterPanel(ttk.Frame):
         self.param_vars[param_name] = var  # Store the variable object
 
         # Add trace to update preview when parameter changes
-        var.trace_add('write', lambda *args: self.update_steps_preview())
+        var.trace_add('write', self._schedule_preview)
 
     def create_widget_for_parameter(self, parent, param_name: str, value):
         """Create appropriate widget based on parameter name and value, returns (widget, var, unit)"""
-        # Time parameters
-        if param_name.endswith('_ms'):
-            var = tk.IntVar(value=int(value))
-            widget = ttk.Spinbox(parent, from_=0, to=60000, increment=100, textvariable=var, width=10)
-            return widget, var, 'ms'
+        spec = _classify_param(param_name)
 
-        # Frequency parameters
-        if 'freq' in param_name.lower() or param_name == 'pulse_rate':
+        if spec.kind == 'int':
+            from_, to, increment = spec.spin
+            var = tk.IntVar(value=int(value))
+            widget = ttk.Spinbox(parent, from_=from_, to=to, increment=increment,
+                                 textvariable=var, width=10)
+        elif spec.kind == 'float':
+            from_, to, increment = spec.spin
+            var = tk.DoubleVar(value=float(value))
+            widget = ttk.Spinbox(parent, from_=from_, to=to, increment=increment,
+                                 textvariable=var, format='%.2f', width=10)
+        elif spec.kind == 'freq':
             is_fractional = isinstance(value, float) and (value < 1.0 or value % 1.0 != 0.0)
             if is_fractional:
                 var = tk.DoubleVar(value=float(value))
@@ -532,64 +745,25 @@ class ParameterPanel(ttk.Frame):
             else:
                 var = tk.IntVar(value=int(value))
                 widget = ttk.Spinbox(parent, from_=1, to=200, increment=1, textvariable=var, width=10)
-            return widget, var, 'Hz'
-
-        # Pulse width (percentage)
-        if param_name == 'pulse_width' or param_name.endswith('_width'):
-            var = tk.IntVar(value=int(value))
-            widget = ttk.Spinbox(parent, from_=0, to=100, increment=1, textvariable=var, width=10)
-            return widget, var, '%'
-
-        # Phase (degrees)
-        if param_name.endswith('_phase'):
-            var = tk.IntVar(value=int(value))
-            widget = ttk.Spinbox(parent, from_=0, to=360, increment=15, textvariable=var, width=10)
-            return widget, var, '°'
-
-        # Normalized values (0.0-1.0)
-        if ('amplitude' in param_name or 'intensity' in param_name or
-            'volume' in param_name):
-            var = tk.DoubleVar(value=float(value))
-            widget = ttk.Spinbox(parent, from_=-1.0, to=1.0, increment=0.01, textvariable=var,
-                               format='%.2f', width=10)
-            return widget, var, ''
-
-        # Offset/boost parameters
-        if 'offset' in param_name or 'boost' in param_name or 'reduction' in param_name or 'shift' in param_name or 'drop' in param_name:
-            var = tk.DoubleVar(value=float(value))
-            widget = ttk.Spinbox(parent, from_=-1.0, to=1.0, increment=0.01, textvariable=var,
-                               format='%.2f', width=10)
-            return widget, var, ''
-
-        # Generic numeric
-        if isinstance(value, (int, float)):
+        elif isinstance(value, (int, float)):
+            # Generic numeric
             var = tk.DoubleVar(value=float(value))
             widget = ttk.Entry(parent, textvariable=var, width=10)
-            return widget, var, ''
+        else:
+            # String fallback
+            var = tk.StringVar(value=str(value))
+            widget = ttk.Entry(parent, textvariable=var, width=10)
 
-        # String fallback
-        var = tk.StringVar(value=str(value))
-        widget = ttk.Entry(parent, textvariable=var, width=10)
-        return widget, var, ''
+        return widget, var, spec.unit
 
     def get_parameter_values(self) -> Dict[str, Any]:
-        """Extract current parameter values from widgets"""
+        """Extract current parameter values from widgets (a new dict on every call)"""
         params = {}
         for param_name, var in self.param_vars.items():
             try:
                 value = var.get()
-
-                # Type conversion based on parameter name
-                if param_name.endswith('_ms') or param_name == 'pulse_rate' or param_name == 'pulse_width':
-                    params[param_name] = int(value) if isinstance(value, (int, float)) else int(float(value))
-                elif 'freq' in param_name.lower():
-                    fval = float(value) if not isinstance(value, (int, float)) else float(value)
-                    params[param_name] = fval if fval % 1.0 != 0.0 else int(fval)
-                elif param_name.endswith('_phase'):
-                    params[param_name] = int(value) if isinstance(value, (int, float)) else int(float(value))
-                else:
-                    # Keep as is (float or string)
-                    params[param_name] = value
+                coerce = _classify_param(param_name).coerce
+                params[param_name] = coerce(value) if coerce else value
             except Exception as e:
                 print(f"Error getting value for {param_name}: {e}")
                 params[param_name] = self.current_params.get(param_name, 0)
@@ -606,6 +780,45 @@ class ParameterPanel(ttk.Frame):
             default_params = self.current_event_definition.get('default_params', {})
             self.load_event_parameters(self.current_event_name, self.current_event_definition, default_params)
 
+    @staticmethod
+    def _build_preview_parts(event_definition: Dict[str, Any]) -> List[Any]:
+        """Pre-render the steps preview of *event_definition*.
+
+        Static lines are kept as strings; each $parameter reference becomes a
+        (var_name, prefix, suffix, fallback_line) tuple filled in per refresh.
+        """
+        parts = []
+        steps = event_definition.get('steps') or []
+        for idx, step in enumerate(steps, start=1):
+            operation = step.get('operation', 'unknown')
+            axis = step.get('axis', 'unknown')
+            params = step.get('params', {})
+
+            parts.append(f"Step {idx}: {operation} on {axis}")
+
+            # Show parameters with substituted values
+            for param_name, param_value in params.items():
+                line = f"  • {param_name}: {param_value}"
+                # Substitute parameter references like $buzz_freq
+                if isinstance(param_value, str) and param_value.startswith('$'):
+                    var_name = param_value[1:]  # Remove $
+                    parts.append((var_name, f"  • {param_name}: ", f" (from ${var_name})", line))
+                else:
+                    parts.append(line)
+
+            parts.append("")  # Blank line between steps
+        return parts
+
+    def _schedule_preview(self, *args):
+        """Coalesce parameter edits into one steps-preview refresh per 120 ms."""
+        if self._preview_job is not None:
+            self.after_cancel(self._preview_job)
+        self._preview_job = self.after(120, self._do_preview_update)
+
+    def _do_preview_update(self):
+        self._preview_job = None
+        self.update_steps_preview()
+
     def update_steps_preview(self):
         """Update the event steps preview with current parameter values"""
         if not self.current_event_name or not hasattr(self, 'current_event_definition'):
@@ -621,32 +834,13 @@ class ParameterPanel(ttk.Frame):
         except:
             current_values = self.current_params.copy()
 
-        # Get event steps
-        steps = self.current_event_definition.get('steps') or []
-
-        # Build preview text
-        preview_lines = []
-        for idx, step in enumerate(steps, start=1):
-            operation = step.get('operation', 'unknown')
-            axis = step.get('axis', 'unknown')
-            params = step.get('params', {})
-
-            preview_lines.append(f"Step {idx}: {operation} on {axis}")
-
-            # Show parameters with substituted values
-            for param_name, param_value in params.items():
-                # Substitute parameter references like $buzz_freq
-                if isinstance(param_value, str) and param_value.startswith('$'):
-                    var_name = param_value[1:]  # Remove $
-                    if var_name in current_values:
-                        actual_value = current_values[var_name]
-                        preview_lines.append(f"  • {param_name}: {actual_value} (from ${var_name})")
-                    else:
-                        preview_lines.append(f"  • {param_name}: {param_value}")
-                else:
-                    preview_lines.append(f"  • {param_name}: {param_value}")
-
-            preview_lines.append("")  # Blank line between steps
+        # Fill the $parameter references of the pre-built step lines
+        preview_lines = [
+            part if isinstance(part, str)
+            else (f"{part[1]}{current_values[part[0]]}{part[2]}" if part[0] in current_values
+                  else part[3])
+            for part in self._preview_parts
+        ]
 
         # Update text widget
         self.steps_text.config(state=tk.NORMAL)
@@ -739,6 +933,7 @@ class CanvasTimelinePanel(ttk.Frame):
         self.events: List[Dict[str, Any]] = []
         self.selected_index: Optional[int] = None
         self.auto_sort_var = tk.BooleanVar(value=True)
+        self._events_sorted = True  # False once events may be out of time order
         self.on_change_time = None  # set externally by the dialog
 
         # ---- Timeline scale ----
@@ -776,6 +971,8 @@ class CanvasTimelinePanel(ttk.Frame):
         self._lanes: List[int] = []       # lane index per event (parallel to self.events)
         self._n_lanes: int = 1
         self._block_rects: List[tuple] = []  # (x1, y1, x2, y2) canvas coords per event
+        self._ev_starts: List[float] = []    # event start times (parallel to self.events)
+        self._ev_durs: List[float] = []      # event durations (parallel to self.events)
         self._conflicts: set = set()         # indices of events overlapping another
         self._layout_dirty: bool = True      # recompute conflicts + notify list on next redraw
         self._redraw_pending = None           # after() id for debounced redraw
@@ -899,11 +1096,13 @@ class CanvasTimelinePanel(ttk.Frame):
     # ------------------------------------------------------------------ #
 
     def add_event(self, time_ms: int, event_name: str, params: Dict[str, Any]):
-        """Append an event, scroll it into view, and refresh the timeline."""
+        """Append an event, scroll it into view, and refresh the timeline.
+
+        The timeline takes ownership of *params*; callers pass a dict they no
+        longer use (e.g. a fresh get_parameter_values() result).
+        """
         self._push_history()
-        self.events.append({'time': time_ms, 'name': event_name, 'params': params.copy()})
-        if self.auto_sort_var.get():
-            self.events.sort(key=lambda e: e['time'])
+        self._place_event({'time': time_ms, 'name': event_name, 'params': params})
         self._scroll_into_view(time_ms)
         self.refresh_display()
         if self.change_callback:
@@ -920,19 +1119,20 @@ class CanvasTimelinePanel(ttk.Frame):
 
     def update_event(self, index: int, time_ms: int, event_name: str,
                      params: Dict[str, Any]) -> int:
-        """Update event at *index*; returns the new index after optional re-sort."""
+        """Update event at *index*; returns the new index after optional re-sort.
+
+        Like add_event, takes ownership of *params*.
+        """
         if not (0 <= index < len(self.events)):
             return index
         self._push_history()
-        ev_obj = {'time': time_ms, 'name': event_name, 'params': params.copy()}
-        self.events[index] = ev_obj
+        ev_obj = {'time': time_ms, 'name': event_name, 'params': params}
         if self.auto_sort_var.get():
-            self.events.sort(key=lambda e: e['time'])
-            try:
-                new_index = self.events.index(ev_obj)
-            except ValueError:
-                new_index = index
+            del self.events[index]
+            new_index = self._place_event(ev_obj)
         else:
+            self.events[index] = ev_obj
+            self._events_sorted = False
             new_index = index
         self.selected_index = new_index
         self.refresh_display()
@@ -940,6 +1140,30 @@ class CanvasTimelinePanel(ttk.Frame):
             self.change_callback()
         return new_index
 
+    def _place_event(self, ev_obj: Dict[str, Any]) -> int:
+        """Insert *ev_obj* (in time order when auto-sort is on) and return its index."""
+        if not self.auto_sort_var.get():
+            self.events.append(ev_obj)
+            self._events_sorted = False
+            return len(self.events) - 1
+        if self._events_sorted:
+            # Binary-search insert; after equal times, like the stable sort it replaces
+            index = _bisect_time_right(self.events, ev_obj['time'])
+            self.events.insert(index, ev_obj)
+            return index
+        self.events.append(ev_obj)
+        return self._sort_events(ev_obj)
+
+    def _sort_events(self, keep: Dict[str, Any]) -> int:
+        """Stable-sort events by time and return the new index of *keep*.
+
+        *keep* is located by identity: an equality scan would compare params
+        dicts field by field and could match an identical duplicate event.
+        """
+        self.events.sort(key=_time_key)
+        self._events_sorted = True
+        return next(i for i, e in enumerate(self.events) if e is keep)
+
     def remove_event(self, index: int):
         """Remove event at *index*."""
         if not (0 <= index < len(self.events)):
@@ -963,14 +1187,37 @@ class CanvasTimelinePanel(ttk.Frame):
         return self.events[index] if 0 <= index < len(self.events) else None
 
     def load_events_from_yaml(self, events_list: List[Dict[str, Any]]):
-        """Load events from a parsed YAML list and fit the view."""
-        self.events = list(events_list)
-        if self.auto_sort_var.get():
-            self.events.sort(key=lambda e: e['time'])
+        """Load events from a parsed YAML list and fit the view.
+
+        The timeline takes ownership of *events_list* (sorted in place) rather
+        than copying it; callers pass the list straight from the parser.
+        """
+        events = events_list if events_list is not None else []
+        # Files saved by this tool are already in time order; a single pass
+        # check is cheaper than a sort when there is nothing to reorder.
+        in_order = all(a['time'] <= b['time'] for a, b in zip(events, events[1:]))
+        if self.auto_sort_var.get() and not in_order:
+            events.sort(key=_time_key)
+            in_order = True
+        self._events_sorted = in_order
+
+        # Reloading the same content (e.g. revert of an unmodified file) leaves
+        # conflicts and the event list unchanged, so only the canvas is redrawn.
+        unchanged = (self.selected_index is None
+                     and self._event_spans(events) == self._event_spans(self.events))
+        self.events = events
         self.selected_index = None
-        self.refresh_display()
+        if unchanged:
+            self.redraw()
+        else:
+            self.refresh_display()
         self.after(60, self.fit_view)  # fit after the canvas has been sized
 
+    @staticmethod
+    def _event_spans(events: List[Dict[str, Any]]) -> List[tuple]:
+        """Return (time, name, duration) per event — what layout and the list show."""
+        return [(ev['time'], ev['name'], ev['params'].get('duration_ms', 0)) for ev in events]
+
     def get_yaml_data(self) -> Dict[str, Any]:
         """Return the YAML-compatible data structure."""
         return {'events': self.events}
@@ -1000,7 +1247,6 @@ class CanvasTimelinePanel(ttk.Frame):
     # ------------------------------------------------------------------ #
 
     def _snapshot(self) -> List[Dict]:
-        import copy
         return copy.deepcopy(self.events)
 
     def _push_history(self):
@@ -1020,8 +1266,8 @@ class CanvasTimelinePanel(ttk.Frame):
         if self._history_pos == len(self._history) - 1:
             self._history.append(self._snapshot())
         self._history_pos -= 1
-        import copy
         self.events = copy.deepcopy(self._history[self._history_pos])
+        self._events_sorted = False
         self.selected_index = None
         self.refresh_display()
         if self.change_callback:
@@ -1033,8 +1279,8 @@ class CanvasTimelinePanel(ttk.Frame):
         if self._history_pos >= len(self._history) - 1:
             return
         self._history_pos += 1
-        import copy
         self.events = copy.deepcopy(self._history[self._history_pos])
+        self._events_sorted = False
         self.selected_index = None
         self.refresh_display()
         if self.change_callback:
@@ -1061,12 +1307,11 @@ class CanvasTimelinePanel(ttk.Frame):
         self.redraw()
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def format_time(ms: int) -> str:
         """Format milliseconds as M:SS (matches old TimelinePanel API)."""
-        total_s = ms / 1000
-        m = int(total_s // 60)
-        s = int(total_s % 60)
-        return f"{m:2d}:{s:02d}"
+        m, rem = divmod(int(ms), 60000)
+        return f"{m:2d}:{rem // 1000:02d}"
 
     # ------------------------------------------------------------------ #
     # Coordinate helpers                                                   #
@@ -1137,19 +1382,23 @@ class CanvasTimelinePanel(ttk.Frame):
         self._n_lanes = max(1, len(lane_ends))
 
     def _find_conflicts(self) -> set:
-        """Return the set of event indices that overlap in time with any other event."""
+        """Return the set of event indices that overlap in time with any other event.
+
+        Sweeps the events in start order, keeping a heap of those still
+        running, so each event is only compared with events it can overlap.
+        """
         conflicts: set = set()
-        for i in range(len(self.events)):
-            a = self.events[i]
-            a_s = a['time']
-            a_e = a_s + a['params'].get('duration_ms', 0)
-            for j in range(i + 1, len(self.events)):
-                b = self.events[j]
-                b_s = b['time']
-                b_e = b_s + b['params'].get('duration_ms', 0)
-                if a_s < b_e and b_s < a_e:
+        active: List[tuple] = []   # heap of (end, start, index) for events not yet ended
+        spans = sorted((ev['time'], ev['time'] + ev['params'].get('duration_ms', 0), i)
+                       for i, ev in enumerate(self.events))
+        for start, end, i in spans:
+            while active and active[0][0] <= start:
+                heapq.heappop(active)
+            for _a_end, a_start, j in active:
+                if a_start < end:
                     conflicts.add(i)
                     conflicts.add(j)
+            heapq.heappush(active, (end, start, i))
         return conflicts
 
     # ------------------------------------------------------------------ #
@@ -1176,6 +1425,10 @@ class CanvasTimelinePanel(ttk.Frame):
         if self._layout_dirty:
             self._assign_lanes()
             self._conflicts = self._find_conflicts()
+        # Per-frame parallel arrays of start/duration so the rect and draw
+        # passes below read plain lists instead of re-walking every event dict.
+        self._ev_starts = [ev['time'] for ev in self.events]
+        self._ev_durs = [ev['params'].get('duration_ms', 0) for ev in self.events]
         self._block_rects = [self._compute_block_rect(i) for i in range(len(self.events))]
 
         cw = self._canvas_w()
@@ -1341,8 +1594,8 @@ class CanvasTimelinePanel(ttk.Frame):
             # Compute the *visual* right edge from the actual duration so blocks
             # are drawn proportionally correct at any zoom level.  The stored
             # _block_rects value uses MIN_BLOCK_W for hit-testing only.
-            dur = ev['params'].get('duration_ms', 0)
-            x2 = self._ms_to_x(ev['time'] + dur) if dur > 0 else x1
+            dur = self._ev_durs[idx]
+            x2 = self._ms_to_x(self._ev_starts[idx] + dur) if dur > 0 else x1
             x2 = max(x2, x1 + 2)  # minimum 2 px so events are always visible
 
             # Skip completely off-screen
@@ -1400,29 +1653,34 @@ class CanvasTimelinePanel(ttk.Frame):
         All events share a single lane row.  Conflicts are indicated visually
         rather than by stacking events into additional rows.
         """
-        ev = self.events[idx]
+        start = self._ev_starts[idx]
+        dur = self._ev_durs[idx]
 
-        x1 = self._ms_to_x(ev['time'])
-        dur = ev['params'].get('duration_ms', 0)
-        x2  = self._ms_to_x(ev['time'] + dur) if dur > 0 else x1 + self.MIN_BLOCK_W
+        x1 = self._ms_to_x(start)
+        x2  = self._ms_to_x(start + dur) if dur > 0 else x1 + self.MIN_BLOCK_W
         x2  = max(x2, x1 + self.MIN_BLOCK_W)
 
         y1 = self.RULER_H + 3
         y2 = y1 + self.TRACK_H - 6
         return x1, y1, x2, y2
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _event_category(event_name: str) -> str:
+        """CATEGORY_COLORS key for the given event name (cached per name)."""
+        for prefix, category in (('mcb_', 'mcb'), ('clutch_', 'clutch'), ('test_', 'test')):
+            if event_name.startswith(prefix):
+                return category
+        return 'general'
+
     def _event_color(self, event_name: str):
         """Return (fill, dark_outline) colour pair for the given event name."""
-        if event_name.startswith('mcb_'):
-            return self.CATEGORY_COLORS['mcb']
-        if event_name.startswith('clutch_'):
-            return self.CATEGORY_COLORS['clutch']
-        if event_name.startswith('test_'):
-            return self.CATEGORY_COLORS['test']
-        return self.CATEGORY_COLORS['general']
-
-    def _block_label(self, event_name: str) -> str:
-        """Short human-readable label for use inside an event block."""
+        return self.CATEGORY_COLORS[self._event_category(event_name)]
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _block_label(event_name: str) -> str:
+        """Short human-readable label for use inside an event block (cached per name)."""
         return (event_name
                 .replace('mcb_', '').replace('clutch_', '').replace('test_', '')
                 .replace('_', ' ').title())
@@ -1861,6 +2119,7 @@ class CanvasTimelinePanel(ttk.Frame):
                     raw_ms = self._drag['orig_time'] + delta_ms
                     snapped = self._apply_snap(raw_ms, dur_ms=float(self._drag['orig_dur']))
                     self.events[idx]['time'] = max(0, int(snapped))
+                    self._events_sorted = False
                 elif self._drag['mode'] == 'resize':  # right-edge resize
                     raw_end_ms = self._drag['orig_time'] + self._drag['orig_dur'] + delta_ms
                     start_ms = float(self.events[idx]['time'])
@@ -1874,6 +2133,7 @@ class CanvasTimelinePanel(ttk.Frame):
                     new_start = max(0, int(snapped_start))
                     new_dur = max(100, int(orig_end - new_start))
                     self.events[idx]['time'] = new_start
+                    self._events_sorted = False
                     self.events[idx]['params']['duration_ms'] = new_dur
 
                 self.redraw()
@@ -1895,12 +2155,7 @@ class CanvasTimelinePanel(ttk.Frame):
 
             if mode == 'move':
                 if self.auto_sort_var.get():
-                    ref = ev
-                    self.events.sort(key=lambda e: e['time'])
-                    try:
-                        self.selected_index = self.events.index(ref)
-                    except ValueError:
-                        self.selected_index = idx
+                    self.selected_index = self._sort_events(ev)
                 self.redraw()
                 if self.on_move_callback:
                     self.on_move_callback(self.selected_index, ev['time'])
@@ -2454,11 +2709,15 @@ class CustomEventsBuilderDialog(tk.Toplevel):
         self.backup_path            = None
         self.current_event_for_params   = None
         self.current_editing_index      = None  # index of the event loaded in params panel
+        self._save_in_progress          = False
+        self._after_save_callbacks: List[Callable[[], None]] = []  # on_saved requests made mid-save
+        self._edit_count                = 0     # bumped on every edit; lets a save tell if it is still current
+        self._pending_status: Optional[str] = None  # latest status text not yet shown
+        self._status_after_id           = None
 
         # Load event definitions
         try:
-            with open(EVENT_DEFINITIONS_PATH, 'r') as f:
-                config_data = yaml.safe_load(f)
+            config_data = _get_event_definitions()
             self.event_definitions    = config_data.get('definitions', {})
             self.event_groups         = config_data.get('groups', [])
             self.normalization_config = config_data.get('normalization', {})
@@ -2499,10 +2758,10 @@ class CustomEventsBuilderDialog(tk.Toplevel):
                 "You have unsaved changes. Save before closing?",
                 parent=self
             )
-            if result is True:        # Yes → save then close
-                self.on_save_file()
-                if self.is_dirty:     # save failed or was cancelled by user
-                    return
+            if result is True:        # Yes → save, then close once the file is written
+                # (a failed or cancelled save never calls back, so the dialog stays open)
+                self.on_save_file(on_saved=self._on_close)
+                return
             elif result is None:      # Cancel → abort close
                 return
             # False → No, discard changes and close
@@ -2579,6 +2838,9 @@ class CustomEventsBuilderDialog(tk.Toplevel):
         self._event_list.configure(yscrollcommand=_ls.set)
         self._event_list.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         _ls.pack(side=tk.RIGHT, fill=tk.Y)
+        self._event_list_scroll = _ls
+        self._event_list.tag_configure('conflict', foreground='#ff6600')
+        self._event_list_rows = []  # (values, tags) currently shown, per row
         self._event_list.bind('<<TreeviewSelect>>', self._on_event_list_select)
         top_paned.add(list_outer, weight=1)
 
@@ -2651,38 +2913,42 @@ class CustomEventsBuilderDialog(tk.Toplevel):
     def _refresh_event_list(self):
         """Sync the Event List Treeview with the current timeline state.
 
-        When the event count is unchanged (move/resize), updates rows in-place
-        via item() — roughly 50x faster than delete+reinsert for 150 rows.
-        Full rebuild only happens when rows are added or removed.
+        Rows are keyed by position (iid ``str(i)``).  Existing rows are updated
+        in place via item() — roughly 50x faster than delete+reinsert for 150
+        rows — and only when they differ from what is already shown, so an
+        insert or removal rewrites just the rows after it.  Rows are only
+        inserted or deleted at the end, to match a changed event count.
         """
         tp = self.timeline_panel
         existing = self._event_list.get_children()
+        conflicts = tp._conflicts
+
+        rows = [(_event_row_values(ev['time'], ev['name'], ev['params'].get('duration_ms', 0)),
+                 ('conflict',) if i in conflicts else ())
+                for i, ev in enumerate(tp.events)]
+        n_shown = len(existing)
 
-        def _row_data(i, ev):
-            t_ms = ev['time']
-            m, s = divmod(t_ms // 1000, 60)
-            t_str = f"{m}:{s:02d}"
-            name  = format_event_display_name(ev['name'])
-            dur   = ev['params'].get('duration_ms', 0)
-            d_str = f"{dur // 1000}s" if dur else '—'
-            tags  = ('conflict',) if i in tp._conflicts else ()
-            return (t_str, name, d_str), tags
-
-        if len(existing) == len(tp.events):
-            # Fast path: update values in-place without delete/reinsert
-            for i, (iid, ev) in enumerate(zip(existing, tp.events)):
-                values, tags = _row_data(i, ev)
+        if len(rows) < n_shown:
+            self._event_list.delete(*existing[len(rows):])
+
+        for iid, row, shown in zip(existing, rows, self._event_list_rows):
+            if row != shown:
+                values, tags = row
                 self._event_list.item(iid, values=values, tags=tags)
-        else:
-            # Count changed (add/remove/load) — full rebuild
-            if existing:
-                self._event_list.delete(*existing)
-            for i, ev in enumerate(tp.events):
-                values, tags = _row_data(i, ev)
-                self._event_list.insert('', 'end', iid=str(i),
-                                        values=values, tags=tags)
 
-        self._event_list.tag_configure('conflict', foreground='#ff6600')
+        if len(rows) > n_shown:
+            # Bulk appends (e.g. loading a file) run with the tree unmanaged so
+            # it is laid out once rather than after every insert
+            bulk = len(rows) - n_shown > 1
+            if bulk:
+                self._event_list.pack_forget()
+            for i in range(n_shown, len(rows)):
+                values, tags = rows[i]
+                self._event_list.insert('', 'end', iid=str(i), values=values, tags=tags)
+            if bulk:
+                self._event_list.pack(side=tk.LEFT, fill=tk.BOTH, expand=True,
+                                      before=self._event_list_scroll)
+        self._event_list_rows = rows
 
         sel = str(tp.selected_index) if tp.selected_index is not None else None
         # Unbind during programmatic selection to prevent <<TreeviewSelect>> from
@@ -2901,7 +3167,7 @@ class CustomEventsBuilderDialog(tk.Toplevel):
 
         try:
             with open(events_file_path, 'r') as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=YamlSafeLoader)
             events = data.get('events', [])
             if events is not None:
                 if 'headroom' in data:
@@ -2911,13 +3177,11 @@ class CustomEventsBuilderDialog(tk.Toplevel):
                 self.event_file_var.set(str(self.event_file_path))
                 self.set_dirty(False)
                 if events:
-                    self.status_label.config(
-                        text=f"Auto-loaded {len(events)} events from {events_file_path.name}")
+                    self._set_status(f"Auto-loaded {len(events)} events from {events_file_path.name}")
                 else:
-                    self.status_label.config(
-                        text=f"Auto-loaded empty event file: {events_file_path.name}")
+                    self._set_status(f"Auto-loaded empty event file: {events_file_path.name}")
         except Exception:
-            self.status_label.config(text="Ready. Could not auto-load events file.")
+            self._set_status("Ready. Could not auto-load events file.")
 
         if self.event_file_path:
             self._try_load_matching_funscript(self.event_file_path)
@@ -2929,6 +3193,7 @@ class CustomEventsBuilderDialog(tk.Toplevel):
     def set_dirty(self, dirty=True):
         self.is_dirty = dirty
         if dirty:
+            self._edit_count += 1
             self.apply_button.config(text="Save and Apply Effects")
         else:
             self.apply_button.config(text="Apply Effects")
@@ -2963,7 +3228,7 @@ class CustomEventsBuilderDialog(tk.Toplevel):
         self.params_panel.current_event_definition = event_def
         self.current_event_for_params = event_data['name']
         display_name = format_event_display_name(event_data['name'])
-        self.status_label.config(text=f"Selected #{event_number}: {display_name}")
+        self._set_status(f"Selected #{event_number}: {display_name}")
 
     def on_canvas_event_move(self, idx: int, new_time_ms: int):
         """Called after a drag-move is committed."""
@@ -2975,7 +3240,7 @@ class CustomEventsBuilderDialog(tk.Toplevel):
                 self.params_panel.time_var.set(event_data['time'])
             except Exception:
                 pass
-        self.status_label.config(text=f"Event moved to {self._fmt_time(new_time_ms)}")
+        self._set_status(f"Event moved to {self._fmt_time(new_time_ms)}")
 
     def on_canvas_event_resize(self, idx: int, new_dur_ms: int):
         """Called after a drag-resize is committed."""
@@ -2985,13 +3250,27 @@ class CustomEventsBuilderDialog(tk.Toplevel):
                     self.params_panel.param_vars['duration_ms'].set(new_dur_ms)
                 except Exception:
                     pass
-        self.status_label.config(text=f"Duration changed to {new_dur_ms} ms")
+        self._set_status(f"Duration changed to {new_dur_ms} ms")
+
+    def _set_status(self, text: str):
+        """Show *text* in the status bar.
+
+        Writes are coalesced through after_idle, so a burst of edits (dragging
+        a block, pasting events) reconfigures the label once with the last text.
+        """
+        self._pending_status = text
+        if self._status_after_id is None:
+            self._status_after_id = self.after_idle(self._flush_status)
+
+    def _flush_status(self):
+        self._status_after_id = None
+        if self._pending_status is not None and self.winfo_exists():
+            self.status_label.config(text=self._pending_status)
+        self._pending_status = None
 
     def _fmt_time(self, ms: int) -> str:
-        total_s = ms / 1000
-        m = int(total_s // 60)
-        s = int(total_s % 60)
-        return f"{m}:{s:02d}"
+        m, rem = divmod(int(ms), 60000)
+        return f"{m}:{rem // 1000:02d}"
 
     # ------------------------------------------------------------------ #
     # Library / parameter panel event handlers                            #
@@ -3023,10 +3302,9 @@ class CustomEventsBuilderDialog(tk.Toplevel):
         if time_dialog.result is None:
             return
         event_def = self.event_definitions[selected_event]
-        params    = event_def.get('default_params', {}).copy()
+        params    = {**event_def['default_params']}
         self.timeline_panel.add_event(time_dialog.result, selected_event, params)
-        self.status_label.config(
-            text=f"Added {selected_event} at {self._fmt_time(time_dialog.result)}")
+        self._set_status(f"Added {selected_event} at {self._fmt_time(time_dialog.result)}")
 
     def on_add_event_to_timeline_direct(self, time_ms: Optional[int] = None):
         """Add the currently selected library event without a dialog.
@@ -3044,10 +3322,9 @@ class CustomEventsBuilderDialog(tk.Toplevel):
 
         t = time_ms if time_ms is not None else int(self.timeline_panel._playhead_ms)
         event_def = self.event_definitions[selected_event]
-        params    = event_def.get('default_params', {}).copy()
+        params    = {**event_def['default_params']}
         self.timeline_panel.add_event(t, selected_event, params)
-        self.status_label.config(
-            text=f"Added {selected_event} at {self._fmt_time(t)}")
+        self._set_status(f"Added {selected_event} at {self._fmt_time(t)}")
 
     def on_edit_timeline_event(self):
         """Load the selected timeline event into the parameters panel."""
@@ -3084,8 +3361,7 @@ class CustomEventsBuilderDialog(tk.Toplevel):
                         self.params_panel.time_var.set(time_dialog.result)
                     except Exception:
                         pass
-                self.status_label.config(
-                    text=f"Event time updated to {self._fmt_time(time_dialog.result)}")
+                self._set_status(f"Event time updated to {self._fmt_time(time_dialog.result)}")
 
     def on_apply_parameters(self):
         """Apply current parameters from the params panel to the editing event."""
@@ -3109,8 +3385,7 @@ class CustomEventsBuilderDialog(tk.Toplevel):
             self.params_panel.editing_label.config(text=f"Editing event #{new_index + 1}")
 
             display_name = format_event_display_name(event_data['name'])
-            self.status_label.config(
-                text=f"Event #{new_index + 1} updated — {display_name} at {self._fmt_time(new_time)}")
+            self._set_status(f"Event #{new_index + 1} updated — {display_name} at {self._fmt_time(new_time)}")
 
     def on_duplicate_timeline_event(self):
         """Duplicate the selected timeline event."""
@@ -3127,7 +3402,7 @@ class CustomEventsBuilderDialog(tk.Toplevel):
                                           initial_value=event_data['time'] + 5000)
             if time_dialog.result is not None:
                 self.timeline_panel.add_event(
-                    time_dialog.result, event_data['name'], event_data['params'])
+                    time_dialog.result, event_data['name'], {**event_data['params']})
 
     # ------------------------------------------------------------------ #
     # File operations                                                       #
@@ -3144,7 +3419,7 @@ class CustomEventsBuilderDialog(tk.Toplevel):
         self.params_panel.show_placeholder()
         self.params_panel.editing_label.config(text="")
         self.params_panel.title_label.config(text="Parameters")
-        self.status_label.config(text="New timeline created")
+        self._set_status("New timeline created")
 
     def on_load_file(self):
         file_path = filedialog.askopenfilename(
@@ -3157,7 +3432,7 @@ class CustomEventsBuilderDialog(tk.Toplevel):
 
         try:
             with open(file_path, 'r') as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=YamlSafeLoader)
             events = data.get('events') or []
             if 'headroom' in data:
                 self.headroom_var.set(data['headroom'])
@@ -3167,7 +3442,7 @@ class CustomEventsBuilderDialog(tk.Toplevel):
             self.set_dirty(False)
             self.current_editing_index = None
             self.params_panel.show_placeholder()
-            self.status_label.config(text=f"Loaded {len(events)} events from file")
+            self._set_status(f"Loaded {len(events)} events from file")
             self._try_load_matching_funscript(self.event_file_path)
         except Exception as e:
             messagebox.showerror("Load Error", f"Failed to load event file: {e}", parent=self)
@@ -3206,21 +3481,21 @@ class CustomEventsBuilderDialog(tk.Toplevel):
 
         new_params = self.params_panel.get_parameter_values()
 
-        # Update in-memory definition
-        self.event_definitions[event_name]['default_params'].update(new_params)
-
         # Write back to the definitions YAML file
         try:
-            with open(EVENT_DEFINITIONS_PATH, 'r') as f:
-                config_data = yaml.safe_load(f)
+            config_data = load_event_definitions()
             config_data['definitions'][event_name]['default_params'].update(new_params)
             with open(EVENT_DEFINITIONS_PATH, 'w') as f:
-                yaml.dump(config_data, f, default_flow_style=False, sort_keys=False)
-            self.status_label.config(text=f"Saved default params for '{event_name}'")
+                yaml.dump(config_data, f, Dumper=YamlSafeDumper,
+                          default_flow_style=False, sort_keys=False)
         except Exception as e:
             messagebox.showerror("Save Error", f"Failed to save defaults: {e}", parent=self)
             return
 
+        # Update in-memory definition only once the file holds the new defaults
+        self.event_definitions[event_name]['default_params'].update(new_params)
+        self._set_status(f"Saved default params for '{event_name}'")
+
         # Offer to update matching timeline events
         matching = [i for i, ev in enumerate(self.timeline_panel.events)
                     if ev['name'] == event_name]
@@ -3276,7 +3551,7 @@ class CustomEventsBuilderDialog(tk.Toplevel):
 
         new_name = result['name']
         new_def = self.event_definitions[new_name]
-        new_params = dict(new_def['default_params'])
+        new_params = {**new_def['default_params']}
 
         if result['keep']:
             for k, v in ev['params'].items():
@@ -3290,7 +3565,19 @@ class CustomEventsBuilderDialog(tk.Toplevel):
             event_time_ms=ev['time'], event_number=new_idx
         )
 
-    def on_save_file(self):
+    def on_save_file(self, on_saved=None):
+        """Save the timeline to its event file.
+
+        Serialisation and writing run on a worker thread; *on_saved* is called
+        on the Tk thread once the file has been written successfully.  If a
+        save is already running, *on_saved* waits for it (and for a follow-up
+        save if there were edits in the meantime) instead of being dropped.
+        """
+        if self._save_in_progress:
+            if on_saved:
+                self._after_save_callbacks.append(on_saved)
+            self._set_status("Saving… (will continue when the current save finishes)")
+            return
         if not self.timeline_panel.events:
             messagebox.showwarning("No Events",
                                    "Timeline is empty. Add events before saving.",
@@ -3325,18 +3612,64 @@ class CustomEventsBuilderDialog(tk.Toplevel):
         if not file_path:
             return
 
+        # Snapshot on the Tk thread so the worker never sees later edits
+        data = self.timeline_panel.get_yaml_data()
+        data = {'headroom': self.headroom_var.get(), **data,
+                'events': [{**ev, 'params': dict(ev['params'])} for ev in data['events']]}
+
+        self._save_in_progress = True
+        self._set_status("Saving…")
+        save_thread = threading.Thread(target=self._save_worker,
+                                       args=(data, str(file_path), self._edit_count, on_saved),
+                                       daemon=True)
+        save_thread.start()
+
+    def _save_worker(self, data, file_path: str, edit_count: int, on_saved):
+        # Write next to the target and swap it in, so a failed save never truncates the file
+        tmp_path = file_path + '.tmp'
         try:
-            data = self.timeline_panel.get_yaml_data()
-            data = {'headroom': self.headroom_var.get(), **data}
-            with open(file_path, 'w') as f:
-                yaml.dump(data, f, default_flow_style=False, sort_keys=False)
-            self.event_file_path = Path(file_path)
-            self.event_file_var.set(str(self.event_file_path))
-            self.set_dirty(False)
-            self.status_label.config(
-                text=f"Saved {len(self.timeline_panel.events)} events")
+            with open(tmp_path, 'w', buffering=1 << 20) as f:
+                _dump_event_file(data, f)
+            os.replace(tmp_path, file_path)
         except Exception as e:
-            messagebox.showerror("Save Error", f"Failed to save event file: {e}", parent=self)
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            self.after(0, self._on_save_done, file_path, len(data['events']), edit_count, on_saved, e)
+        else:
+            self.after(0, self._on_save_done, file_path, len(data['events']), edit_count, on_saved, None)
+
+    def _on_save_done(self, file_path: str, n_events: int, edit_count: int, on_saved, error):
+        self._save_in_progress = False
+        if not self.winfo_exists():  # dialog closed without waiting for the save
+            return
+        waiting, self._after_save_callbacks = self._after_save_callbacks, []
+        if error is not None:
+            self._set_status("Save failed.")
+            messagebox.showerror("Save Error", f"Failed to save event file: {error}", parent=self)
+            return
+        self.event_file_path = Path(file_path)
+        self.event_file_var.set(str(self.event_file_path))
+        if edit_count == self._edit_count:  # no edits while the file was being written
+            self.set_dirty(False)
+        self._set_status(f"Saved {n_events} events")
+        if on_saved:
+            on_saved()
+        if not waiting or not self.winfo_exists():
+            return
+        if self.is_dirty:
+            # Edited after this save's snapshot: save again before running them
+            self.on_save_file(on_saved=lambda: self._run_after_save(waiting))
+        else:
+            self._run_after_save(waiting)
+
+    def _run_after_save(self, callbacks: List[Callable[[], None]]):
+        """Run on_saved callbacks queued during a save, stopping if one closes the dialog."""
+        for callback in callbacks:
+            if not self.winfo_exists():
+                return
+            callback()
 
     def on_view_yaml(self):
         if not self.timeline_panel.events:
@@ -3345,7 +3678,8 @@ class CustomEventsBuilderDialog(tk.Toplevel):
 
         yaml_data = self.timeline_panel.get_yaml_data()
         yaml_data = {'headroom': self.headroom_var.get(), **yaml_data}
-        yaml_text = yaml.dump(yaml_data, default_flow_style=False, sort_keys=False)
+        yaml_text = yaml.dump(yaml_data, Dumper=YamlSafeDumper,
+                              default_flow_style=False, sort_keys=False)
 
         dialog = tk.Toplevel(self)
         dialog.title("Generated YAML")
@@ -3403,15 +3737,19 @@ class CustomEventsBuilderDialog(tk.Toplevel):
                     parent=self)
                 if not result:
                     return
-            self.on_save_file()
-            if not self.event_file_path:
-                return
+            # Processing reads the saved file, so start it once the save lands
+            self.on_save_file(on_saved=self._start_apply_effects)
+            return
 
-        self.status_label.config(text="Processing… Please wait.")
+        self._start_apply_effects()
+
+    def _start_apply_effects(self):
+        self._set_status("Processing… Please wait.")
         processing_thread = threading.Thread(target=self.apply_effects_worker, daemon=True)
         processing_thread.start()
 
     def apply_effects_worker(self):
+        from processing.event_processor import process_events, EventProcessorError
         try:
             success_message, _, backup_path = process_events(
                 str(self.event_file_path),
@@ -3434,13 +3772,13 @@ class CustomEventsBuilderDialog(tk.Toplevel):
         if backup_path:
             self.restore_button.config(state='normal',
                                        text=f"Restore Backup ({backup_path.name})")
-            self.status_label.config(text="Processing complete. Backup available.")
+            self._set_status("Processing complete. Backup available.")
         else:
-            self.status_label.config(text="Processing complete.")
+            self._set_status("Processing complete.")
 
     def on_processing_error(self, error_message: str):
         messagebox.showerror("Processing Error", error_message, parent=self)
-        self.status_label.config(text="Processing failed.")
+        self._set_status("Processing failed.")
 
     def on_restore_backup(self):
         if not self.backup_path or not self.backup_path.exists():
@@ -3454,20 +3792,45 @@ class CustomEventsBuilderDialog(tk.Toplevel):
         if not confirm:
             return
 
+        self.restore_button.config(state='disabled')
+        self._set_status("Restoring backup… Please wait.")
+        restore_thread = threading.Thread(target=self._restore_backup_worker,
+                                          args=(self.backup_path,), daemon=True)
+        restore_thread.start()
+
+    def _restore_backup_worker(self, backup_path: Path):
         try:
-            target_dir = self.backup_path.parent
-            with zipfile.ZipFile(self.backup_path, 'r') as zipf:
-                file_list = zipf.namelist()
-                zipf.extractall(target_dir)
-            messagebox.showinfo("Restore Complete",
-                                f"Successfully restored {len(file_list)} files.",
-                                parent=self)
-            self.restore_button.config(state='disabled')
-            self.status_label.config(text="Backup restored successfully.")
-            if self.event_file_path:
-                self.on_load_file()
+            with zipfile.ZipFile(backup_path, 'r') as zipf:
+                file_count = len(zipf.infolist())
+                zipf.extractall(backup_path.parent)
         except Exception as e:
-            messagebox.showerror("Restore Error", f"Failed to restore: {e}", parent=self)
+            self.after(0, self._on_restore_error, str(e))
+        else:
+            self.after(0, self._on_restore_done, file_count)
+
+    def _on_restore_done(self, file_count: int):
+        if not self.winfo_exists():  # dialog closed while the backup was restoring
+            return
+        messagebox.showinfo("Restore Complete",
+                            f"Successfully restored {file_count} files.",
+                            parent=self)
+        self._set_status("Backup restored successfully.")
+        if self.event_file_path:
+            self.on_load_file()
+
+    def _on_restore_error(self, message: str):
+        if not self.winfo_exists():
+            return
+        self.restore_button.config(state='normal')
+        self._set_status("Backup restore failed.")
+        messagebox.showerror("Restore Error", f"Failed to restore: {message}", parent=self)
+
+
+# "M:SS" (groups 1, 2) or plain milliseconds (group 3)
+_TIME_RE = re.compile(r'^\s*(?:(\d+)\s*:\s*(\d+)|(\d+))\s*$')
+
+# "WxH+X+Y" as returned by wm geometry
+_GEOMETRY_RE = re.compile(r'(\d+)x(\d+)\+(-?\d+)\+(-?\d+)')
 
 
 class TimeInputDialog(tk.Toplevel):
@@ -3490,8 +3853,8 @@ class TimeInputDialog(tk.Toplevel):
 
         self.time_var = tk.StringVar()
         if initial_value > 0:
-            minutes = initial_value // 60000
-            seconds = (initial_value % 60000) // 1000
+            minutes, rem = divmod(initial_value, 60000)
+            seconds = rem // 1000
             self.time_var.set(f"{minutes}:{seconds:02d}")
         else:
             self.time_var.set("0:00")
@@ -3508,29 +3871,25 @@ class TimeInputDialog(tk.Toplevel):
         ttk.Button(frame, text="Cancel", command=self.destroy).grid(row=2, column=1, padx=5)
 
         self.update_idletasks()
-        x = parent.winfo_x() + (parent.winfo_width()  - self.winfo_width())  // 2
-        y = parent.winfo_y() + (parent.winfo_height() - self.winfo_height()) // 2
-        self.geometry(f"+{x}+{y}")
+        # One wm geometry query per window instead of four winfo_* round trips
+        pw, ph, px, py = map(int, _GEOMETRY_RE.match(parent.winfo_toplevel().wm_geometry()).groups())
+        w, h, _x, _y = map(int, _GEOMETRY_RE.match(self.wm_geometry()).groups())
+        self.geometry(f"+{px + (pw - w) // 2}+{py + (ph - h) // 2}")
 
         self.wait_window()
 
     def on_ok(self):
-        time_str = self.time_var.get().strip()
-        try:
-            if ':' in time_str:
-                parts   = time_str.split(':')
-                minutes = int(parts[0])
-                seconds = int(parts[1])
-                self.result = (minutes * 60 + seconds) * 1000
-            else:
-                self.result = int(time_str)
-            if self.result < 0:
-                raise ValueError("Time cannot be negative")
-            self.destroy()
-        except ValueError:
+        m = _TIME_RE.match(self.time_var.get())
+        if m is None:
             messagebox.showerror("Invalid Time",
                                  "Please enter time as MM:SS or milliseconds.",
                                  parent=self)
+            return
+        if m.group(3) is not None:
+            self.result = int(m.group(3))
+        else:
+            self.result = (int(m.group(1)) * 60 + int(m.group(2))) * 1000
+        self.destroy()
 
 
 if __name__ == '__main__':
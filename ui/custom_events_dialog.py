@@ -1,3 +1,5 @@
+import io
+import os
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import threading
@@ -9,6 +11,7 @@ import sys
 sys.path.append(str(Path(__file__).parent.parent))
 
 from processing.event_processor import process_events, _parse_and_validate_user_events, _load_event_definitions, EventProcessorError
+from processing.definitions_cache import file_stamp
 
 
 def get_resource_path(relative_path: str) -> Path:
@@ -43,6 +46,22 @@ def get_resource_path(relative_path: str) -> Path:
 # Path to the event definitions YAML file
 EVENT_DEFINITIONS_PATH = get_resource_path("config.event_definitions.yml")
 
+# Definitions already loaded this session, keyed by path: (file stamp, definitions)
+_DEFS_CACHE = {}
+
+
+def _get_event_definitions(definitions_path: Path) -> dict:
+    """Event definitions from *definitions_path*, reused across dialog openings until the file changes."""
+    try:
+        stamp = file_stamp(definitions_path)
+    except OSError:
+        stamp = None  # let _load_event_definitions report the missing file
+    cached = _DEFS_CACHE.get(definitions_path)
+    if cached is None or stamp is None or cached[0] != stamp:
+        definitions, _ = _load_event_definitions(definitions_path)
+        cached = _DEFS_CACHE[definitions_path] = (stamp, definitions)
+    return cached[1]
+
 
 class CustomEventsDialog(tk.Toplevel):
     """
@@ -66,10 +85,12 @@ class CustomEventsDialog(tk.Toplevel):
         self.validated_user_events = []
         self.event_definitions = {} # To store loaded event definitions
         self.backup_path = None  # Store the backup path after processing
+        self._validation_token = 0  # bumped per file selection; stale validation results are dropped
+        self._last_preview = ""  # text currently shown in the preview box
 
         # Load event definitions on init
         try:
-            self.event_definitions, _ = _load_event_definitions(EVENT_DEFINITIONS_PATH)
+            self.event_definitions = _get_event_definitions(EVENT_DEFINITIONS_PATH)
         except EventProcessorError as e:
             messagebox.showerror("Error Loading Definitions", str(e), parent=self)
             self.destroy() # Close if definitions cannot be loaded
@@ -89,31 +110,61 @@ class CustomEventsDialog(tk.Toplevel):
         self.event_file_var.set(file_path)
         self.status_label.config(text=f"Validating {Path(file_path).name}...")
         self.apply_button.config(state="disabled")
-        self.update_preview("")
+        # The old preview stays up until the result arrives, so update_preview
+        # can diff against what is actually on screen
         self.validated_user_events = []
 
-        try:
-            self.validated_user_events = _parse_and_validate_user_events(Path(file_path), self.event_definitions)
-            preview_content = []
-            for event in self.validated_user_events:
-                preview_content.append(f"--- Event: {event['name']} at {event['time']}ms ---")
-                for step in event['processed_steps']:
-                    op = step['operation']
-                    axis = step['axis']
-                    offset = step.get('start_offset', 0)
-                    params_str = ", ".join([f"{k}={v}" for k, v in step['params'].items()])
-                    preview_content.append(f"  + {op} on {axis} (offset: {offset}ms) with [{params_str}]")
-            
-            self.update_preview("\n".join(preview_content))
-            self.status_label.config(text=f"Ready to apply {len(self.validated_user_events)} user events.")
-            self.apply_button.config(state="normal")
+        # Parse and validate on a worker thread so a large file doesn't freeze the dialog
+        self._validation_token += 1
+        validation_thread = threading.Thread(
+            target=self._validate_worker,
+            args=(Path(file_path), self._validation_token),
+            daemon=True
+        )
+        validation_thread.start()
 
+    def _validate_worker(self, file_path: Path, token: int):
+        """Parse and validate the event file, then hand the result back to the Tk thread."""
+        try:
+            events = _parse_and_validate_user_events(file_path, self.event_definitions)
+            preview_text = self._build_preview_text(events)
         except EventProcessorError as e:
-            self.status_label.config(text=f"Error: {e}")
-            messagebox.showerror("Validation Error", str(e), parent=self)
+            self.after(0, self._on_validation_error, token, f"Error: {e}", "Validation Error", str(e))
         except Exception as e:
-            self.status_label.config(text=f"An unexpected error occurred: {e}")
-            messagebox.showerror("Error", f"An unexpected error occurred: {e}", parent=self)
+            self.after(0, self._on_validation_error, token, f"An unexpected error occurred: {e}",
+                       "Error", f"An unexpected error occurred: {e}")
+        else:
+            self.after(0, self._on_validation_done, token, events, preview_text)
+
+    @staticmethod
+    def _build_preview_text(events) -> str:
+        """Render the validated events and their processed steps for the preview box."""
+        buf = io.StringIO()
+        write = buf.write
+        for event in events:
+            write(f"--- Event: {event['name']} at {event['time']}ms ---\n")
+            for step in event['processed_steps']:
+                params_str = ", ".join(f"{k}={v}" for k, v in step['params'].items())
+                write(f"  + {step['operation']} on {step['axis']} "
+                      f"(offset: {step.get('start_offset', 0)}ms) with [{params_str}]\n")
+        return buf.getvalue()[:-1]  # no newline after the last line
+
+    def _on_validation_done(self, token: int, events, preview_text: str):
+        """Callback on successful validation; ignored if another file has been selected since."""
+        if token != self._validation_token or not self.winfo_exists():
+            return
+        self.validated_user_events = events
+        self.update_preview(preview_text)
+        self.status_label.config(text=f"Ready to apply {len(events)} user events.")
+        self.apply_button.config(state="normal")
+
+    def _on_validation_error(self, token: int, status: str, title: str, message: str):
+        """Callback on failed validation; ignored if another file has been selected since."""
+        if token != self._validation_token or not self.winfo_exists():
+            return
+        self.update_preview("")  # don't leave the previous file's preview up
+        self.status_label.config(text=status)
+        messagebox.showerror(title, message, parent=self)
 
     def start_processing_thread(self):
         """Start the event processing in a background thread to keep the UI responsive."""
@@ -208,11 +259,24 @@ class CustomEventsDialog(tk.Toplevel):
             messagebox.showerror("Restore Error", f"Failed to restore backup: {e}", parent=self)
 
     def update_preview(self, content: str):
-        """Updates the text in the preview box."""
+        """Updates the text in the preview box.
+
+        Only the lines after the part shared with the previous preview are
+        replaced, so re-validating a file that grew at the end (or did not
+        change at all) doesn't rewrite the whole widget.
+        """
+        if content == self._last_preview:
+            return
+        # Keep whole lines only: Tk line.column indices are safe for any text
+        keep = len(os.path.commonprefix((self._last_preview, content)))
+        keep = content.rfind('\n', 0, keep) + 1
+        first_line = content.count('\n', 0, keep) + 1
+
         self.event_preview_text.config(state='normal')
-        self.event_preview_text.delete(1.0, tk.END)
-        self.event_preview_text.insert(tk.END, content)
+        self.event_preview_text.delete(f"{first_line}.0", tk.END)
+        self.event_preview_text.insert(tk.END, content[keep:])
         self.event_preview_text.config(state='disabled')
+        self._last_preview = content
 
     def setup_ui(self):
         """Setup the user interface for the dialog."""
@@ -1116,7 +1116,6 @@ class ParameterTabs(ttk.Notebook):
 
         # Import matplotlib for curve visualization
         try:
-            import matplotlib.pyplot as plt
             from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
             from matplotlib.figure import Figure
             import numpy as np